@@ -26,6 +26,7 @@ from PyQt5.QtCore import QProcess
 from videomorph.converter import tasklist
 from videomorph.converter.library import Library
 from videomorph.converter.profile import Profile
+from videomorph.converter.video import Video
 
 
 class TestConversionLib:
@@ -40,15 +41,19 @@ class TestConversionLib:
     @classmethod
     def setup_class(cls):
         """Setup method to run before all test."""
-        gen = cls.media_list.populate(('Dad.mpg',))
-        next(gen)
-        next(gen)
+        video = Video('Dad.mpg')
+        video.probe_duration()
+        cls.media_list.add_video(video, output_dir='.')
 
     @classmethod
     def teardown_class(cls):
         """Teardown method to run after all test."""
         cls.media_list.get_task(0).delete_output('.', tagged=True)
 
+    def setup(self):
+        """Setup method to run before each test."""
+        self.conv_lib.reader.reset()
+
     def get_conversion_cmd(self):
         """Return a conversion command."""
         cmd = self.media_list.get_task(position=0).build_conversion_cmd(
@@ -61,7 +66,7 @@ class TestConversionLib:
     def test_get_library_path(self):
         """Test Library.library_path."""
         assert self.conv_lib.path in {'/usr/bin/ffmpeg',
-                                              '/usr/local/bin/ffmpeg'}
+                                      '/usr/local/bin/ffmpeg'}
 
     def test_prober_path(self):
         """Test the Library.prober_path."""
@@ -83,14 +88,53 @@ class TestConversionLib:
 
     def test_catch_library_error_true(self):
         """Test _OutputReader.catch_library_error() -> true."""
-        self.conv_lib.reader.update_read('Some random output with '
-                                         'Unknown encoder error')
+        self.conv_lib.reader.update_read(b'Some random output with '
+                                         b'Unknown encoder error')
         assert self.conv_lib.reader.catch_library_error() == 'Unknown encoder'
 
     def test_catch_library_error_false(self):
         """Test _OutputReader.catch_library_error() -> false."""
-        self.conv_lib.reader.update_read('Some random output with '
-                                         'no error')
+        self.conv_lib.reader.update_read(b'Some random output with '
+                                         b'no error')
+        assert self.conv_lib.reader.catch_library_error() is None
+
+    def test_catch_library_error_split(self):
+        """Test _OutputReader.catch_library_error() error in two chunks."""
+        self.conv_lib.reader.update_read(b'Some random output\nUnknown enc')
+        assert self.conv_lib.reader.catch_library_error() is None
+        self.conv_lib.reader.update_read(b"oder 'foo'\n")
+        assert self.conv_lib.reader.catch_library_error() == 'Unknown encoder'
+
+    def test_update_read_split_line(self):
+        """Test _OutputReader.update_read() time line in two chunks."""
+        assert not self.conv_lib.reader.update_read(
+            b'frame=  250 fps= 50 q=2.0 size=    512kB ti')
+        assert not self.conv_lib.reader.has_time_read
+        assert self.conv_lib.reader.update_read(
+            b'me=00:01:02.50 bitrate= 128.0kbits/s speed=2x\r')
+        assert self.conv_lib.reader.time == 62.5
+        assert self.conv_lib.reader.bitrate == '128.0kbits/s'
+
+    def test_update_read_bitrate_not_available(self):
+        """Test _OutputReader.bitrate with N/A on the last line."""
+        self.conv_lib.reader.update_read(
+            b'frame=  250 fps= 50 q=2.0 size=    512kB '
+            b'time=00:00:10.00 bitrate= 128.0kbits/s speed=2x\r'
+            b'frame=  251 fps= 50 q=2.0 size=N/A '
+            b'time=00:00:10.04 bitrate=N/A speed=2x\r')
+        assert self.conv_lib.reader.time == 10.04
+        assert self.conv_lib.reader.bitrate == 'N/A'
+
+    def test_reset(self):
+        """Test _OutputReader.reset() forget the previous conversion."""
+        self.conv_lib.reader.update_read(
+            b'time=00:00:10.00 bitrate= 128.0kbits/s\rUnknown enc')
+        assert self.conv_lib.reader.has_time_read
+        self.conv_lib.reader.reset()
+        assert not self.conv_lib.reader.has_time_read
+        assert self.conv_lib.reader.bitrate == 'N/A'
+        # The incomplete line is gone too
+        self.conv_lib.reader.update_read(b'oder\n')
         assert self.conv_lib.reader.catch_library_error() is None
 
     def test_stop_converter(self):
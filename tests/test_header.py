@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# File name: test_header.py
+#
+#   VideoMorph - A PyQt5 frontend to ffmpeg.
+#   Copyright 2016-2018 VideoMorph Development Team
+
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""This module provides tests for header.py module."""
+
+import struct
+from os.path import join as join_path
+from tempfile import TemporaryDirectory
+
+from videomorph.converter import header
+
+
+def _box(box_type, payload):
+    """Return an MP4 box."""
+    return struct.pack('>I4s', 8 + len(payload), box_type) + payload
+
+
+def _element(element_id, payload):
+    """Return a Matroska element with a 8 bytes size."""
+    id_length = (element_id.bit_length() + 7) // 8
+    return (element_id.to_bytes(id_length, 'big') +
+            (0x01 << 56 | len(payload)).to_bytes(8, 'big') + payload)
+
+
+def _mp4(version=0, timescale=1000, duration=90500):
+    """Return an MP4 file content with the moov box after the data."""
+    if version == 1:
+        mvhd = bytes(4 + 16) + struct.pack('>IQ', timescale, duration)
+    else:
+        mvhd = bytes(4 + 8) + struct.pack('>II', timescale, duration)
+    mvhd = bytes([version]) + mvhd[1:]
+    return (_box(b'ftyp', b'isom' + bytes(4)) + _box(b'mdat', bytes(100)) +
+            _box(b'moov', _box(b'mvhd', mvhd + bytes(80))))
+
+
+def _mkv(duration=90500.0, timecode_scale=1000000):
+    """Return a Matroska file content."""
+    info = (_element(0x2AD7B1, timecode_scale.to_bytes(3, 'big')) +
+            _element(0x4489, struct.pack('>d', duration)))
+    segment = (_element(0x114D9B74, bytes(10)) + _element(0xEC, bytes(5)) +
+               _element(0x1549A966, info))
+    return (_element(0x1A45DFA3, _element(0x4282, b'matroska')) +
+            _element(0x18538067, segment))
+
+
+def _read_duration(file_name, content):
+    """Write the content to a file and read the duration from it."""
+    with TemporaryDirectory() as temp_dir:
+        file_path = join_path(temp_dir, file_name)
+        with open(file_path, 'wb') as video_file:
+            video_file.write(content)
+        return header.read_duration(file_path)
+
+
+def test_mp4_duration():
+    """Read the duration of an MP4 file."""
+    assert _read_duration('video.mp4', _mp4()) == 90.5
+
+
+def test_mp4_version_1_duration():
+    """Read the duration of an MP4 file with a version 1 mvhd box."""
+    assert _read_duration('video.MOV', _mp4(version=1)) == 90.5
+
+
+def test_mp4_unknown_duration():
+    """An MP4 file with unknown duration needs ffprobe."""
+    assert _read_duration('video.mp4', _mp4(duration=0xFFFFFFFF)) is None
+
+
+def test_mp4_zero_duration():
+    """An MP4 file with zero duration needs ffprobe."""
+    assert _read_duration('video.mp4', _mp4(duration=0)) is None
+
+
+def test_mp4_truncated():
+    """A truncated MP4 file needs ffprobe."""
+    assert _read_duration('video.mp4', _mp4()[:-90]) is None
+
+
+def test_mkv_duration():
+    """Read the duration of a Matroska file."""
+    assert _read_duration('video.mkv', _mkv()) == 90.5
+
+
+def test_webm_timecode_scale():
+    """Read the duration of a WebM file with a custom timecode scale."""
+    assert _read_duration('video.webm',
+                          _mkv(duration=9050.0,
+                               timecode_scale=10000000)) == 90.5
+
+
+def test_mkv_truncated():
+    """A truncated Matroska file needs ffprobe."""
+    assert _read_duration('video.mkv', _mkv()[:-6]) is None
+
+
+def test_mkv_oversized_element():
+    """An Info child claiming a huge size is skipped, not read."""
+    # A Title element with a 2**56 - 16 bytes size and no payload at all
+    title = bytes([0x7B, 0xA9, 0x01] + [0xFF] * 6 + [0xF0])
+    info = _element(0x4489, struct.pack('>d', 90500.0)) + title
+    content = (_element(0x1A45DFA3, _element(0x4282, b'matroska')) +
+               _element(0x18538067, _element(0x1549A966, info)))
+    assert _read_duration('video.mkv', content) == 90.5
+
+
+def test_mkv_not_matroska():
+    """A file with a Matroska extension but other content needs ffprobe."""
+    assert _read_duration('video.mkv', _mp4()) is None
+
+
+def test_unsupported_container():
+    """Other containers need ffprobe."""
+    assert _read_duration('video.avi', _mkv()) is None
+
+
+def test_missing_file():
+    """A missing file needs ffprobe."""
+    assert header.read_duration('/missing/video.mp4') is None
@@ -24,11 +24,20 @@ import nose
 
 from videomorph.converter.library import Library
 from videomorph.converter.tasklist import TaskList
-from videomorph.converter.tasklist import Video
+from videomorph.converter.video import Video
 from videomorph.converter.profile import Profile
 from videomorph.converter import STATUS
 
 
+def add_videos(media_list, files_paths):
+    """Add the videos to the list as VideoCreator does, but in one go."""
+    videos = [Video(file_path) for file_path in
+              media_list.files_to_add(files_paths)]
+    for video in videos:
+        video.probe_duration()
+    media_list.add_videos(videos, output_dir='.')
+
+
 class TestMedia:
     """Class for testing media.py module."""
 
@@ -39,12 +48,10 @@ class TestMedia:
     def setup(self):
         """Setup method."""
         self.media_list = TaskList(profile=self.profile)
-        self.gen = self.media_list.populate(('Dad.mpg',))
-        next(self.gen)
-        next(self.gen)
+        add_videos(self.media_list, ('Dad.mpg',))
 
-    def test_populate(self):
-        """Test TaskList.populate()."""
+    def test_add_videos(self):
+        """Test TaskList.add_videos()."""
         assert len(self.media_list) == 1 == self.media_list.length
         assert self.media_list[0].input_path.__str__() == 'Dad.mpg'
 
@@ -139,7 +146,7 @@ class TestMedia:
     def test_add_file_twice(self):
         """Testing adding the same file twice."""
         assert self.media_list.length == 1
-        self.media_list.populate(('Dad.mpg',))
+        add_videos(self.media_list, ('Dad.mpg',))
         assert self.media_list.length == 1
 
     def test_build_conversion_cmd(self):
@@ -214,18 +221,20 @@ class TestMedia:
         self.media_list.clear()
         assert not self.media_list
 
-    def test_populate_files_count(self):
-        """Test TaskList.populate() yield amount of video files."""
+    def test_files_to_add(self):
+        """Test TaskList.files_to_add()."""
         media_list = TaskList(profile=self.profile)
-        gen = media_list.populate(('Dad.mpg',))
-        assert next(gen) == 1
+        assert media_list.files_to_add(('Dad.mpg', 'Dad.mpg')) == ['Dad.mpg']
+
+    def test_files_to_add_already_added(self):
+        """Test TaskList.files_to_add() skip the files in the list."""
+        assert self.media_list.files_to_add(('Dad.mpg',)) == []
 
-    def test_populate_first_file_name(self):
-        """Test TaskList.populate() yield first video file name."""
+    def test_files_to_add_invalid_extension(self):
+        """Test TaskList.files_to_add() with a file that is not a video."""
         media_list = TaskList(profile=self.profile)
-        gen = media_list.populate(('Dad.mpg',))
-        next(gen)
-        assert next(gen) == 'Dad.mpg'
+        assert media_list.files_to_add(('Dad.txt',)) == []
+        assert list(media_list.not_added_files) == ['Dad.txt']
 
 
 if __name__ == '__main__':
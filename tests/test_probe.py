@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# File name: test_probe.py
+#
+#   VideoMorph - A PyQt5 frontend to ffmpeg.
+#   Copyright 2016-2018 VideoMorph Development Team
+
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""This module provides tests for probe.py module."""
+
+import json
+import sqlite3
+from os import stat
+from os import utime
+from os.path import join as join_path
+from tempfile import TemporaryDirectory
+
+from videomorph.converter import probe
+from videomorph.converter.probe import Probe
+from videomorph.converter.probe import _ProbeCache
+
+_DURATION_ARGS = ['-show_entries', 'stream=duration:format=duration']
+
+
+def _read_duration(probe_output):
+    """Return the duration read from an ffprobe json output."""
+    return Probe._read_duration(json.loads(probe_output))
+
+
+def test_read_duration_format():
+    """Read the format duration."""
+    assert _read_duration('{"streams": [{"duration": "10.0"}], '
+                          '"format": {"duration": "90.5"}}') == 90.5
+
+
+def test_read_duration_missing_format_duration():
+    """Read the stream duration if the format has none."""
+    assert _read_duration('{"streams": [{}, {"duration": "90.5"}], '
+                          '"format": {}}') == 90.5
+
+
+def test_read_duration_not_available():
+    """Skip the N/A durations."""
+    assert _read_duration('{"streams": [{"duration": "N/A"}, '
+                          '{"duration": "90.5"}], '
+                          '"format": {"duration": "N/A"}}') == 90.5
+
+
+def test_read_duration_zero_format_duration():
+    """Read the stream duration if the format one is zero."""
+    assert _read_duration('{"streams": [{"duration": "90.5"}], '
+                          '"format": {"duration": "0.000000"}}') == 90.5
+
+
+def test_read_duration_no_streams():
+    """Read the format duration if there are no streams."""
+    assert _read_duration('{"format": {"duration": "90.5"}}') == 90.5
+
+
+def test_read_duration_not_available_at_all():
+    """Return zero if no duration is available."""
+    assert _read_duration('{"format": {"duration": "N/A"}}') == 0.0
+    assert _read_duration('{}') == 0.0
+
+
+def test_parse_probe_not_available_params():
+    """Report N/A for the params left out of a stream."""
+    video_probe = Probe('video.mkv')
+    video_probe._probe_json = lambda args: json.loads(
+        '{"streams": [{"codec_type": "video", "codec_name": "vp9", '
+        '"width": 1280, "height": 720}, '
+        '{"codec_type": "audio", "codec_name": "opus"}], '
+        '"format": {"format_name": "matroska,webm", '
+        '"duration": "90.5"}}')
+    assert video_probe.video_info['bit_rate'] == 'N/A'
+    assert video_probe.video_info['width'] == '1280'
+    assert video_probe.audio_info['codec_long_name'] == 'N/A'
+    assert video_probe.format_info['bit_rate'] == 'N/A'
+    assert 'TAG:language' not in video_probe.subtitle_info
+
+
+def _write(file_path, content):
+    """Write the content to a file."""
+    with open(file_path, 'w') as video_file:
+        video_file.write(content)
+
+
+def test_cache_get():
+    """Get a cached output."""
+    with TemporaryDirectory() as temp_dir:
+        cache = _ProbeCache(join_path(temp_dir, 'probe.sqlite'))
+        video_path = join_path(temp_dir, 'video.mpg')
+        _write(video_path, 'video')
+        assert cache.get(video_path, _DURATION_ARGS) is None
+        cache.set(video_path, _DURATION_ARGS, '{"format": {}}')
+        assert cache.get(video_path, _DURATION_ARGS) == '{"format": {}}'
+
+
+def test_cache_args():
+    """Cache the outputs for different args apart."""
+    with TemporaryDirectory() as temp_dir:
+        cache = _ProbeCache(join_path(temp_dir, 'probe.sqlite'))
+        video_path = join_path(temp_dir, 'video.mpg')
+        _write(video_path, 'video')
+        cache.set(video_path, _DURATION_ARGS, 'duration')
+        cache.set(video_path, ['-show_format', '-show_streams'], 'full')
+        assert cache.get(video_path, _DURATION_ARGS) == 'duration'
+        assert cache.get(video_path,
+                         ['-show_format', '-show_streams']) == 'full'
+        assert cache.get(video_path, ['-show_format']) is None
+
+
+def test_cache_mtime_changed():
+    """A file modified since it was cached is not found."""
+    with TemporaryDirectory() as temp_dir:
+        cache = _ProbeCache(join_path(temp_dir, 'probe.sqlite'))
+        video_path = join_path(temp_dir, 'video.mpg')
+        _write(video_path, 'video')
+        cache.set(video_path, _DURATION_ARGS, 'duration')
+        file_stat = stat(video_path)
+        utime(video_path, ns=(file_stat.st_atime_ns,
+                              file_stat.st_mtime_ns + 10 ** 9))
+        assert cache.get(video_path, _DURATION_ARGS) is None
+
+
+def test_cache_size_changed():
+    """A file whose size changed since it was cached is not found."""
+    with TemporaryDirectory() as temp_dir:
+        cache = _ProbeCache(join_path(temp_dir, 'probe.sqlite'))
+        video_path = join_path(temp_dir, 'video.mpg')
+        _write(video_path, 'video')
+        file_stat = stat(video_path)
+        cache.set(video_path, _DURATION_ARGS, 'duration')
+        _write(video_path, 'longer video')
+        # Keep the mtime, so just the size tells the file apart
+        utime(video_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+        assert cache.get(video_path, _DURATION_ARGS) is None
+
+
+def test_cache_missing_file():
+    """A missing file is neither cached nor found."""
+    with TemporaryDirectory() as temp_dir:
+        cache = _ProbeCache(join_path(temp_dir, 'probe.sqlite'))
+        video_path = join_path(temp_dir, 'video.mpg')
+        cache.set(video_path, _DURATION_ARGS, 'duration')
+        assert cache.get(video_path, _DURATION_ARGS) is None
+
+
+def test_cache_directory_created():
+    """Create the missing folder of the cache database."""
+    with TemporaryDirectory() as temp_dir:
+        db_path = join_path(temp_dir, 'config', 'probe.sqlite')
+        cache = _ProbeCache(db_path)
+        video_path = join_path(temp_dir, 'video.mpg')
+        _write(video_path, 'video')
+        cache.set(video_path, _DURATION_ARGS, 'duration')
+        assert _cached_paths(db_path) == {video_path}
+
+
+def _cached_paths(db_path):
+    """Return the paths in the cache database."""
+    connection = sqlite3.connect(db_path)
+    try:
+        return {row[0] for row in connection.execute(
+            'SELECT path FROM probe')}
+    finally:
+        connection.close()
+
+
+def test_cache_stale_output_deleted():
+    """The output of a file modified since it was cached is deleted."""
+    with TemporaryDirectory() as temp_dir:
+        db_path = join_path(temp_dir, 'probe.sqlite')
+        cache = _ProbeCache(db_path)
+        video_path = join_path(temp_dir, 'video.mpg')
+        _write(video_path, 'video')
+        cache.set(video_path, _DURATION_ARGS, 'duration')
+        _write(video_path, 'longer video')
+        assert cache.get(video_path, _DURATION_ARGS) is None
+        assert not _cached_paths(db_path)
+
+
+def test_cache_size():
+    """Just the most recently cached outputs are kept."""
+    cache_size = probe._PROBE_CACHE_SIZE
+    probe._PROBE_CACHE_SIZE = 2
+    try:
+        with TemporaryDirectory() as temp_dir:
+            db_path = join_path(temp_dir, 'probe.sqlite')
+            cache = _ProbeCache(db_path)
+            video_paths = [join_path(temp_dir, name) for
+                           name in ('a.mpg', 'b.mpg', 'c.mpg')]
+            for video_path in video_paths:
+                _write(video_path, 'video')
+                cache.set(video_path, _DURATION_ARGS, 'duration')
+            # The cache is trimmed when it is opened
+            assert _ProbeCache(db_path).get(video_paths[0],
+                                            _DURATION_ARGS) is None
+            assert _cached_paths(db_path) == set(video_paths[1:])
+    finally:
+        probe._PROBE_CACHE_SIZE = cache_size
@@ -20,6 +20,10 @@
 
 """This module provides tests for utils.py module."""
 
+from os import makedirs
+from os.path import join
+from tempfile import TemporaryDirectory
+
 import nose
 
 from videomorph.converter import utils
@@ -128,5 +132,20 @@ def test_write_size_gib():
     assert utils.write_size(1585558454) == '1.5GiB'
 
 
+def test_iter_video_files():
+    """Test iter_video_files() search the subdirectories too."""
+    with TemporaryDirectory() as directory:
+        makedirs(join(directory, 'sub'))
+        for name in ('a.mpg', 'b.txt', join('sub', 'c.MKV')):
+            open(join(directory, name), 'w').close()
+        assert sorted(utils.iter_video_files(directory, {'.mpg', '.mkv'})) == [
+            join(directory, 'a.mpg'), join(directory, 'sub', 'c.MKV')]
+
+
+def test_iter_video_files_missing_directory():
+    """Test iter_video_files() with a directory that doesn't exist."""
+    assert not list(utils.iter_video_files('/hypothetical_dir', {'.mpg'}))
+
+
 if __name__ == '__main__':
     nose.runmodule()
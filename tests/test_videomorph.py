@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# File name: test_videomorph.py
+#
+#   VideoMorph - A PyQt5 frontend to ffmpeg.
+#   Copyright 2016-2018 VideoMorph Development Team
+
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""This module provides tests for videomorph.py module."""
+
+from os.path import join as join_path
+from tempfile import TemporaryDirectory
+from threading import Event
+from time import monotonic
+
+from PyQt5.QtCore import QDir
+from PyQt5.QtCore import QSettings
+from PyQt5.QtWidgets import QApplication
+
+from videomorph.forms import videomorph
+
+_APP = QApplication.instance() or QApplication([])
+
+
+def _process_events_until(condition, timeout=5.0):
+    """Process the app events until the condition is met."""
+    start = monotonic()
+    while not condition() and monotonic() - start < timeout:
+        _APP.processEvents()
+
+
+def _saved_output_dir(config_ini):
+    """Return the output folder in the settings file."""
+    return QSettings(config_ini, QSettings.IniFormat).value('output_dir')
+
+
+def test_output_dir_check_timeout():
+    """Keep the saved output folder if its check times out."""
+    config_ini = videomorph._CONFIG_INI
+    check_timeout = videomorph._DIR_CHECK_TIMEOUT
+    isdir = videomorph.isdir
+    checked = Event()
+
+    def slow_isdir(directory):
+        checked.wait(5)
+        return isdir(directory)
+
+    with TemporaryDirectory() as temp_dir:
+        videomorph._CONFIG_INI = join_path(temp_dir, 'config.ini')
+        videomorph._DIR_CHECK_TIMEOUT = 0
+        videomorph.isdir = slow_isdir
+        try:
+            settings = QSettings(videomorph._CONFIG_INI, QSettings.IniFormat)
+            settings.setValue('output_dir', temp_dir)
+            settings.sync()
+
+            main_win = videomorph.VideoMorphMW()
+            _process_events_until(lambda: main_win._output_dir_check.canceled)
+            checked.set()
+            main_win._write_app_settings()
+            assert main_win.output_edit.text() == QDir.homePath()
+            assert _saved_output_dir(videomorph._CONFIG_INI) == temp_dir
+            main_win.deleteLater()
+        finally:
+            checked.set()
+            videomorph._CONFIG_INI = config_ini
+            videomorph._DIR_CHECK_TIMEOUT = check_timeout
+            videomorph.isdir = isdir
+
+
+def test_output_dir_check_missing():
+    """Replace the saved output folder if it is gone."""
+    config_ini = videomorph._CONFIG_INI
+
+    with TemporaryDirectory() as temp_dir:
+        videomorph._CONFIG_INI = join_path(temp_dir, 'config.ini')
+        try:
+            settings = QSettings(videomorph._CONFIG_INI, QSettings.IniFormat)
+            settings.setValue('output_dir', join_path(temp_dir, 'missing'))
+            settings.sync()
+
+            main_win = videomorph.VideoMorphMW()
+            _process_events_until(lambda: main_win._output_dir_check is None)
+            main_win._write_app_settings()
+            assert (_saved_output_dir(videomorph._CONFIG_INI) ==
+                    QDir.homePath())
+            main_win.deleteLater()
+        finally:
+            videomorph._CONFIG_INI = config_ini
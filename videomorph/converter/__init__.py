@@ -19,11 +19,8 @@
 
 """This module defines the converter package."""
 
+import os
 from collections import namedtuple
-try:
-    from os import cpu_count
-except ImportError:
-    cpu_count = None
 
 from .vmpath import BASE_DIR
 from .vmpath import SYS_PATHS
@@ -38,7 +35,10 @@ LOCALE = get_locale()
 VIDEO_FILTERS = ('*.mov *.f4v *.webm *.dat *.ogg *.mkv *.wv *.wmv'
                  ' *.flv *.vob *.ts *.mts *.3gp *.ogv *.mpg *.mp4 *.avi')
 
-VALID_VIDEO_EXT = {ext.lstrip('*') for ext in VIDEO_FILTERS.split()}
+# Keep in sync with VIDEO_FILTERS
+VALID_VIDEO_EXT = frozenset(('.mov', '.f4v', '.webm', '.dat', '.ogg', '.mkv',
+                             '.wv', '.wmv', '.flv', '.vob', '.ts', '.mts',
+                             '.3gp', '.ogv', '.mpg', '.mp4', '.avi'))
 
 MediaFileStatus = namedtuple('MediaFileStatus', 'todo done stopped')
 STATUS = MediaFileStatus('Todo', 'Done', 'Stopped')
@@ -46,6 +46,10 @@ STATUS = MediaFileStatus('Todo', 'Done', 'Stopped')
 XMLFiles = namedtuple('XMLFiles', 'default customized')
 XML_FILES = XMLFiles('default.xml', 'customized.xml')
 
-CPU_CORES = (cpu_count() - 1 if
-             cpu_count() is not None
-             else 0)
+# Honor the CPU affinity (e.g. container limits) where it is available
+try:
+    _CPU_COUNT = len(os.sched_getaffinity(0))
+except AttributeError:
+    _CPU_COUNT = os.cpu_count() or 1
+
+CPU_CORES = max(1, _CPU_COUNT - 1)
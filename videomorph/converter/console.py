@@ -21,13 +21,13 @@
 
 import argparse
 import sys
-from os import walk
 from os.path import isdir
 from pathlib import Path
 
 from . import APP_NAME
 from . import VERSION
 from . import VALID_VIDEO_EXT
+from .utils import iter_video_files
 
 
 def run_on_console(app, main_win):
@@ -75,10 +75,17 @@ def run_on_console(app, main_win):
     if files:
         # Avoid duplicated files
         files_to_add = set(files)
+
+        # Start encoding as soon as the files are added, just this once,
+        # later adds from the GUI must not start a conversion
+        def start_encoding():
+            main_win.mediaFilesAdded.disconnect(start_encoding)
+            main_win.start_encoding()
+
+        main_win.mediaFilesAdded.connect(start_encoding)
         # Add files
         main_win.add_media_files(*files_to_add)
         main_win.show()
-        main_win.start_encoding()
         sys.exit(app.exec_())
 
 
@@ -88,11 +95,7 @@ def search_directory_recursively(directory, files=None):
         files = []
 
     if isdir(directory):
-        for dir_path, _, files_names in walk(directory):
-            for file_name in files_names:
-                path = Path(dir_path, file_name)
-                if path.suffix in VALID_VIDEO_EXT:
-                    files.append(path.__str__())
+        files.extend(iter_video_files(directory, VALID_VIDEO_EXT))
     else:
         raise IsADirectoryError("Directory: {0}, doesn't exist".format(
             directory))
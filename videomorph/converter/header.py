@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+# File name: header.py
+#
+#   VideoMorph - A PyQt5 frontend to ffmpeg.
+#   Copyright 2016-2018 VideoMorph Development Team
+
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+
+#       http://www.apache.org/licenses/LICENSE-2.0
+
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""This module provides a container header parser to read video durations.
+
+Only the few header bytes holding the duration are read, so for MP4 and
+Matroska files (the most common ones) there is no need to run ffprobe.
+"""
+
+import struct
+from os.path import splitext
+
+# MP4 box types
+_MOOV = b'moov'
+_MVHD = b'mvhd'
+
+# Matroska element IDs
+_EBML = 0x1A45DFA3
+_SEGMENT = 0x18538067
+_INFO = 0x1549A966
+_CLUSTER = 0x1F43B675
+_TIMECODE_SCALE = 0x2AD7B1
+_DURATION = 0x4489
+
+_DEFAULT_TIMECODE_SCALE = 1000000  # In nanoseconds
+# Stop looking for the Info element after this many level 1 elements
+_MAX_SEGMENT_ELEMENTS = 64
+
+
+def read_duration(file_path):
+    """Return the duration in seconds read from the container header.
+
+    None is returned if the container is not supported or the duration
+    is not in the header, so ffprobe is needed to get it.
+    """
+    extension = splitext(file_path)[1].lower()
+    reader = _READERS.get(extension)
+    if reader is None:
+        return None
+
+    try:
+        with open(file_path, 'rb') as video_file:
+            duration = reader(video_file)
+    except (OSError, IndexError, ValueError, OverflowError, MemoryError,
+            struct.error):
+        return None
+
+    if duration is None or duration <= 0:
+        return None
+
+    return duration
+
+
+def _read_mp4_duration(video_file):
+    """Return the duration from the mvhd box inside the moov box."""
+    moov = _find_mp4_box(video_file, _MOOV)
+    if moov is None:
+        return None
+
+    mvhd = _find_mp4_box(video_file, _MVHD, end=moov)
+    if mvhd is None:
+        return None
+
+    version = video_file.read(4)[0]
+    if version == 1:
+        # Creation and modification times are 64 bits long
+        video_file.seek(16, 1)
+        timescale, duration = struct.unpack('>IQ', video_file.read(12))
+        unknown = 0xFFFFFFFFFFFFFFFF
+    else:
+        video_file.seek(8, 1)
+        timescale, duration = struct.unpack('>II', video_file.read(8))
+        unknown = 0xFFFFFFFF
+
+    if not timescale or duration == unknown:
+        return None
+
+    return duration / timescale
+
+
+def _find_mp4_box(video_file, box_type, end=None):
+    """Seek to the payload of the given box, return its end offset.
+
+    The search starts at the current file position and goes on until the
+    end offset (or the end of file) is reached.
+    """
+    while end is None or video_file.tell() < end:
+        start = video_file.tell()
+        header = video_file.read(8)
+        if len(header) < 8:
+            return None
+
+        size, current_type = struct.unpack('>I4s', header)
+        if size == 1:  # 64 bits size after the type
+            size = struct.unpack('>Q', video_file.read(8))[0]
+        elif size == 0:  # The box goes on until the end of file
+            position = video_file.tell()
+            size = video_file.seek(0, 2) - start
+            video_file.seek(position)
+
+        if size < 8:
+            return None
+
+        if current_type == box_type:
+            return start + size
+
+        video_file.seek(start + size)
+
+    return None
+
+
+def _read_mkv_duration(video_file):
+    """Return the duration from the Segment Info element."""
+    if _read_element_id(video_file) != _EBML:
+        return None
+    header_size = _read_element_size(video_file)
+    if header_size is None:
+        return None
+    video_file.seek(header_size, 1)
+
+    if _read_element_id(video_file) != _SEGMENT:
+        return None
+    _read_element_size(video_file)  # The Segment size may be unknown
+
+    for _ in range(_MAX_SEGMENT_ELEMENTS):
+        element_id = _read_element_id(video_file)
+        size = _read_element_size(video_file)
+        if element_id == _INFO:
+            return _read_mkv_info(video_file, size)
+        # The Info element always comes before the first Cluster
+        if element_id in {None, _CLUSTER} or size is None:
+            return None
+        video_file.seek(size, 1)
+
+    return None
+
+
+def _read_mkv_info(video_file, info_size):
+    """Return the duration in seconds from the Info element payload."""
+    if info_size is None:
+        return None
+
+    end = video_file.tell() + info_size
+    timecode_scale = _DEFAULT_TIMECODE_SCALE
+    duration = None
+    while video_file.tell() < end:
+        element_id = _read_element_id(video_file)
+        size = _read_element_size(video_file)
+        if element_id is None or size is None:
+            return None
+
+        # A malformed element goes beyond the Info one, stop there
+        if video_file.tell() + size > end:
+            break
+
+        # Only the small payloads needed are read, the rest is skipped so
+        # a malformed size can't make us read a huge amount of data
+        if element_id not in {_TIMECODE_SCALE, _DURATION} or size > 8:
+            video_file.seek(size, 1)
+            continue
+
+        data = video_file.read(size)
+        if element_id == _TIMECODE_SCALE:
+            timecode_scale = int.from_bytes(data, 'big')
+        elif size == 4:
+            duration = struct.unpack('>f', data)[0]
+        elif size == 8:
+            duration = struct.unpack('>d', data)[0]
+
+    if duration is None:
+        return None
+
+    return duration * timecode_scale / 1e9
+
+
+def _read_element_id(video_file):
+    """Return an EBML element ID, None on end of file or invalid ID."""
+    first = video_file.read(1)
+    if not first:
+        return None
+
+    length = _vint_length(first[0], max_length=4)
+    if length is None:
+        return None
+
+    return int.from_bytes(first + video_file.read(length - 1), 'big')
+
+
+def _read_element_size(video_file):
+    """Return an EBML element data size, None if unknown or invalid."""
+    first = video_file.read(1)
+    if not first:
+        return None
+
+    length = _vint_length(first[0], max_length=8)
+    if length is None:
+        return None
+
+    # Remove the length marker bit from the value
+    value = first[0] & (0xFF >> length)
+    for byte in video_file.read(length - 1):
+        value = (value << 8) | byte
+
+    # All value bits set to one means an unknown size
+    if value == (1 << (7 * length)) - 1:
+        return None
+
+    return value
+
+
+def _vint_length(first_byte, max_length):
+    """Return the length of a variable size integer from its first byte."""
+    for length in range(1, max_length + 1):
+        if first_byte & (0x80 >> (length - 1)):
+            return length
+
+    return None
+
+
+_READERS = {'.mp4': _read_mp4_duration,
+            '.m4v': _read_mp4_duration,
+            '.mov': _read_mp4_duration,
+            '.mkv': _read_mkv_duration,
+            '.webm': _read_mkv_duration}
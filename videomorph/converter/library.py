@@ -43,7 +43,11 @@ class Library:
 
     def catch_errors(self):
         """Catch the library error when running."""
-        self.error = self.reader.catch_library_error()
+        error = self.reader.catch_library_error()
+        # Keep the error caught until it is shown, the next reads may
+        # not have it anymore
+        if error is not None:
+            self.error = error
 
     @staticmethod
     def run_player(file_path):
@@ -68,6 +72,9 @@ class _Converter:
     def setup_converter(self, reader, finisher, process_channel):
         """Set up the QProcess object."""
         self._process.setProcessChannelMode(process_channel)
+        # ffmpeg writes its progress to stderr, so read just that channel
+        if process_channel == QProcess.SeparateChannels:
+            self._process.setReadChannel(QProcess.StandardError)
         self._process.readyRead.connect(reader)
         self._process.finished.connect(finisher)
 
@@ -77,9 +84,10 @@ class _Converter:
 
     def stop_converter(self):
         """Terminate the encoding process."""
-        self._process.terminate()
-        if self.converter_is_running:
-            self._process.kill()
+        process = self._process
+        process.terminate()
+        if process.state() == QProcess.Running:
+            process.kill()
 
     def converter_finished_disconnect(self, connected):
         """Disconnect the QProcess.finished method."""
@@ -101,9 +109,13 @@ class _Converter:
         """Call QProcess.exit_status method."""
         return self._process.exitStatus()
 
+    def converter_exit_code(self):
+        """Call QProcess.exitCode method."""
+        return self._process.exitCode()
+
     def read_converter_output(self):
-        """Call QProcess.readAll method."""
-        return str(self._process.readAll())
+        """Call QProcess.readAll method and return its output as bytes."""
+        return bytes(self._process.readAll())
 
     @property
     def converter_is_running(self):
@@ -17,107 +17,308 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-"""This module provides Probe Class."""
+"""This module provides the Probe Class."""
 
+import json
+import os
+import sqlite3
+from os import makedirs
+from os import stat
+from os.path import abspath
+from os.path import dirname
+from os.path import join as join_path
+from threading import Lock
+
+from .header import read_duration
 from .vmpath import PROBE_PATH
+from .vmpath import SYS_PATHS
 from .launchers import spawn_process
 
+# ffprobe args to get a json output and to get just the duration entries
+_JSON_ARGS = ['-loglevel', 'quiet', '-print_format', 'json']
+_DURATION_ARGS = ['-show_entries', 'stream=duration:format=duration']
+# Bytes at the beginning of the file that ffprobe reads to get the info
+_READ_AHEAD_SIZE = 1 << 20
+# Probe outputs kept in the cache, the most recently cached ones
+_PROBE_CACHE_SIZE = 10000
+
 
 class Probe:
     """Probe Class to get info about a video."""
 
+    # Params to collect from every section of the probe output
+    _selected_params = {'format': {'filename',
+                                   'nb_streams',
+                                   'format_name',
+                                   'format_long_name',
+                                   'duration',
+                                   'size',
+                                   'bit_rate'},
+                        'video': {'codec_name',
+                                  'codec_long_name',
+                                  'bit_rate',
+                                  'width',
+                                  'height'},
+                        'audio': {'codec_name',
+                                  'codec_long_name'},
+                        'subtitle': {'codec_name',
+                                     'codec_long_name',
+                                     'TAG:language'}}
+
     def __init__(self, video_path):
         """Class initializer."""
         self._probe_path = PROBE_PATH
         self._video_path = video_path
+        self._info = None
+        self._duration = None
 
     @property
     def format_info(self):
         """Return general info about file."""
-        return self._parse_probe_format()
+        return self.load()['format']
 
     @property
     def video_info(self):
         """Return general info about video stream."""
-        return self._parse_probe_video_stream()
+        return self.load()['video']
 
     @property
     def audio_info(self):
         """Return general info about audio stream."""
-        return self._parse_probe_audio_stream()
+        return self.load()['audio']
 
     @property
     def subtitle_info(self):
         """Return general info about subtitle stream."""
-        return self._parse_probe_sub_stream()
+        return self.load()['subtitle']
+
+    @property
+    def duration(self):
+        """Return the file duration in seconds."""
+        return self.probe_duration()
+
+    def probe_duration(self):
+        """Probe just for the file duration, 0.0 if it is not available.
+
+        The duration is read from the container header when possible (MP4
+        and Matroska files), otherwise ffprobe is asked for the duration
+        entries only, which is much cheaper than the full probe. The full
+        probe is deferred until some other info is actually needed.
+        """
+        if self._duration is None:
+            self._duration = read_duration(self._video_path)
+
+        if self._duration is None:
+            self._duration = self._read_duration(
+                self._probe_json(_DURATION_ARGS))
+
+        return self._duration
+
+    def load(self):
+        """Run the probe once and cache the info about the file."""
+        if self._info is None:
+            self._info = self._parse_probe()
+
+        return self._info
 
     def _probe(self, args):
-        """Return the probe output as a file like object."""
-        process_args = [self._probe_path, self._video_path.__str__()]
-        process_args[1:-1] = args
-        probe_output = spawn_process(process_args).stdout
+        """Return the probe output as a str."""
+        process_args = [self._probe_path] + args + [str(self._video_path)]
+        _read_ahead(self._video_path)
+        probe_output, _ = spawn_process(process_args).communicate()
 
         return probe_output
 
-    def _parse_probe(self, selected_params, cmd):
-        """Parse the probe output."""
-        info = {}
+    def _probe_json(self, args):
+        """Return the probe output parsed from json, {} if not valid.
+
+        Valid outputs are cached on disk, so a file that didn't change since
+        it was probed doesn't need to run ffprobe again.
+        """
+        cached_output = _PROBE_CACHE.get(self._video_path, args)
+        probe_output = cached_output or self._probe(_JSON_ARGS + args)
+
+        try:
+            probe_info = json.loads(probe_output)
+        except ValueError:
+            return {}
+
+        if cached_output is None and probe_info:
+            _PROBE_CACHE.set(self._video_path, args, probe_output)
+
+        return probe_info
+
+    @staticmethod
+    def _read_duration(probe_info):
+        """Return the format duration, falling back to the streams one.
+
+        Some containers don't report the format duration (or report it as
+        zero) while their streams do, and vice versa.
+        """
+        durations = [probe_info.get('format', {}).get('duration')]
+        durations.extend(stream.get('duration') for
+                         stream in probe_info.get('streams', []))
+
+        for duration in durations:
+            try:
+                duration = float(duration)
+            except (TypeError, ValueError):
+                continue
+            if duration > 0:
+                return duration
+
+        return 0.0
+
+    def _parse_probe(self):
+        """Parse the probe output for the format and all the streams.
+
+        A single ffprobe run reports everything in json format, streams are
+        then sorted out by their codec_type.
+        """
+        info = {section: {} for section in self._selected_params}
 
-        with self._probe(cmd) as probe_file:
-            stream_count = -1
+        probe_info = self._probe_json(['-show_format', '-show_streams'])
 
-            for format_line in probe_file:
-                format_line = format_line.strip()
-                param = format_line.split('=')
+        if self._duration is None:
+            self._duration = self._read_duration(probe_info)
 
-                if '[STREAM]' in format_line:
-                    stream_count += 1
+        self._update_info(info['format'], probe_info.get('format', {}),
+                          'format', 0)
 
-                if '=' in format_line and param[0] in selected_params:
-                    if not param[0] in info:
-                        info[param[0]] = param[1]
-                    else:
-                        info[param[0] + '_{0}'.format(stream_count)] = param[1]
+        streams_count = dict.fromkeys(('video', 'audio', 'subtitle'), -1)
+        for stream in probe_info.get('streams', []):
+            codec_type = stream.get('codec_type')
+            if codec_type not in streams_count:
+                continue
+            streams_count[codec_type] += 1
+            # Flatten the tags the same way the ffprobe default writer does
+            for tag, value in stream.get('tags', {}).items():
+                stream['TAG:' + tag] = value
+            self._update_info(info[codec_type], stream, codec_type,
+                              streams_count[codec_type])
 
         return info
 
-    def _parse_probe_format(self):
-        """Parse the probe output."""
-        selected_params = {'filename',
-                           'nb_streams',
-                           'format_name',
-                           'format_long_name',
-                           'duration',
-                           'size',
-                           'bit_rate'}
-
-        return self._parse_probe(selected_params=selected_params,
-                                 cmd=['-show_format'])
-
-    def _parse_probe_video_stream(self):
-        """Parse the probe output."""
-        selected_params = {'codec_name',
-                           'codec_long_name',
-                           'bit_rate',
-                           'width',
-                           'height'}
-
-        return self._parse_probe(selected_params=selected_params,
-                                 cmd=['-show_streams', '-select_streams', 'v'])
-
-    def _parse_probe_audio_stream(self):
-        """Parse the probe output."""
-        selected_params = {'codec_name',
-                           'codec_long_name'}
-
-        return self._parse_probe(selected_params=selected_params,
-                                 cmd=['-show_streams', '-select_streams', 'a'])
-
-    def _parse_probe_sub_stream(self):
-        """Parse the probe output."""
-        selected_params = {'codec_name',
-                           'codec_long_name',
-                           'TAG:language'}
-
-        return self._parse_probe(selected_params=selected_params,
-                                 cmd=['-show_streams', '-select_streams', 's'])
+    def _update_info(self, info, section, section_name, stream_count):
+        """Add the selected params of a probe output section to info.
+
+        The json writer leaves out the params that the default writer
+        reports as N/A, they are added back so the info keys are always
+        there. Tags are left out by both writers.
+        """
+        for param in self._selected_params[section_name]:
+            value = section.get(param)
+            if value is None:
+                if param.startswith('TAG:'):
+                    continue
+                value = 'N/A'
+            if param not in info:
+                info[param] = str(value)
+            else:
+                info[param + '_{0}'.format(stream_count)] = str(value)
+
+
+def _read_ahead(video_path):
+    """Ask the kernel to start reading the file before ffprobe opens it.
+
+    The page cache is warmed up in the background, which shortens the
+    probe on slow storage (e.g. network shares or spinning disks).
+    """
+    if not hasattr(os, 'posix_fadvise'):  # Not available on Windows
+        return
+
+    try:
+        file_descriptor = os.open(str(video_path), os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.posix_fadvise(file_descriptor, 0, _READ_AHEAD_SIZE,
+                         os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(file_descriptor)
+
+
+class _ProbeCache:
+    """Cache the probe outputs keyed by file path, mtime and size."""
+
+    def __init__(self, db_path):
+        """Class initializer."""
+        self._db_path = db_path
+        self._connection = None
+        self._lock = Lock()
+
+    def get(self, video_path, args):
+        """Return the cached output for a probe, None if not cached."""
+        key = self._key(video_path, args)
+        if key is None:
+            return None
+
+        with self._lock:
+            try:
+                with self._connect() as connection:
+                    row = connection.execute(
+                        'SELECT mtime, size, output FROM probe '
+                        'WHERE path=? AND args=?', key[:2]).fetchone()
+                    if row is None:
+                        return None
+                    if row[:2] != key[2:]:
+                        # The file changed, its output is no use anymore
+                        connection.execute(
+                            'DELETE FROM probe WHERE path=? AND args=?',
+                            key[:2])
+                        return None
+            except (sqlite3.Error, OSError):
+                return None
+
+        return row[2]
+
+    def set(self, video_path, args, output):
+        """Cache the output for a probe."""
+        key = self._key(video_path, args)
+        if key is None:
+            return
+
+        with self._lock:
+            try:
+                with self._connect() as connection:
+                    connection.execute(
+                        'INSERT OR REPLACE INTO probe VALUES (?, ?, ?, ?, ?)',
+                        key + (output,))
+            except (sqlite3.Error, OSError):
+                pass
+
+    def _connect(self):
+        """Return the connection to the cache database."""
+        if self._connection is None:
+            makedirs(dirname(self._db_path), exist_ok=True)
+            self._connection = sqlite3.connect(self._db_path,
+                                               check_same_thread=False)
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS probe(path TEXT, args TEXT, '
+                'mtime INT, size INT, output TEXT, PRIMARY KEY(path, args))')
+            # Outputs are replaced with a new rowid, so the lowest ones
+            # are the least recently cached
+            with self._connection:
+                self._connection.execute(
+                    'DELETE FROM probe WHERE rowid NOT IN (SELECT rowid '
+                    'FROM probe ORDER BY rowid DESC LIMIT ?)',
+                    (_PROBE_CACHE_SIZE,))
+
+        return self._connection
+
+    @staticmethod
+    def _key(video_path, args):
+        """Return the cache key for a probe, None if file is unreachable."""
+        try:
+            file_stat = stat(str(video_path))
+        except OSError:
+            return None
+
+        return (abspath(str(video_path)), ' '.join(args),
+                file_stat.st_mtime_ns, file_stat.st_size)
+
+
+_PROBE_CACHE = _ProbeCache(join_path(SYS_PATHS.config, 'probe.sqlite'))
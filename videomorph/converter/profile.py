@@ -23,6 +23,7 @@ import re
 from collections import OrderedDict
 from shutil import copy2
 from os import makedirs
+from os import stat
 from os.path import exists, getsize
 from os.path import getmtime
 from os.path import join as join_path
@@ -39,6 +40,8 @@ from .exceptions import ProfileBlankParamsError
 from .exceptions import ProfileBlankPresetError
 from .exceptions import ProfileExtensionError
 
+_TAG_REGEX = re.compile(r'[A-Z][0-9]?')
+
 
 class Profile:
     """Base class for a Conversion Profile."""
@@ -47,6 +50,7 @@ class Profile:
         """Class initializer."""
         self._xml_profile = _XMLProfile(xml_files=XML_FILES)
         self._quality = None
+        self._quality_tag = None
         self.extension = None
         self.params = None
 
@@ -57,6 +61,7 @@ class Profile:
     def update(self, new_quality):
         """Set the target Quality and other parameters needed to get it."""
         self._quality = new_quality
+        self._quality_tag = None
         # Update the params and extension when the target quality change
         self.params = self._xml_profile.get_xml_profile_attr(
             target_quality=self._quality,
@@ -68,13 +73,17 @@ class Profile:
     @property
     def quality_tag(self):
         """Generate a tag from profile quality string."""
-        tag_regex = re.compile(r'[A-Z][0-9]?')
-        tag = ''.join(tag_regex.findall(self._quality))
+        # The tag is generated once for every target quality
+        if self._quality_tag is None:
+            tag = ''.join(_TAG_REGEX.findall(self._quality))
+
+            if not tag:
+                tag = ''.join(word[0] for
+                              word in self._quality.split()).upper()
 
-        if not tag:
-            tag = ''.join(word[0] for word in self._quality.split()).upper()
+            self._quality_tag = '[' + tag + ']-'
 
-        return '[' + tag + ']-'
+        return self._quality_tag
 
 
 class _XMLProfile:
@@ -85,6 +94,8 @@ class _XMLProfile:
         # Create xml files.
         self._xml_files = xml_files
         self._create_xml_files()
+        # Qualities per locale along with the xml files stamp they came from
+        self._qualities_cache = {}
 
     def restore_default_profiles(self):
         """Restore default profiles."""
@@ -153,7 +164,16 @@ class _XMLProfile:
         raise ValueError('Wrong quality or param.')
 
     def get_xml_profile_qualities(self, locale):
-        """Return a list of available Qualities per conversion profile."""
+        """Return a list of available Qualities per conversion profile.
+
+        The xml files are parsed again only if they changed since the last
+        call, so the returned dict must not be modified.
+        """
+        xml_files_stamp = self._xml_files_stamp()
+        cached = self._qualities_cache.get(locale)
+        if cached is not None and cached[0] == xml_files_stamp:
+            return cached[1]
+
         qualities_per_profile = OrderedDict()
 
         for xml_file in self._xml_files:
@@ -164,8 +184,21 @@ class _XMLProfile:
                 else:
                     qualities_per_profile[element.tag] += qualities
 
+        if xml_files_stamp is not None:
+            self._qualities_cache[locale] = (xml_files_stamp,
+                                             qualities_per_profile)
+
         return qualities_per_profile
 
+    def _xml_files_stamp(self):
+        """Return the mtime and size of the xml files, None on error."""
+        try:
+            return tuple((file_stat.st_mtime_ns, file_stat.st_size) for
+                         file_stat in (stat(self._user_xml_file_path(xml_file))
+                                       for xml_file in self._xml_files))
+        except OSError:
+            return None
+
     @staticmethod
     def _get_qualities(element, locale):
         qualities = []
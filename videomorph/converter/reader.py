@@ -21,55 +21,90 @@
 
 import re
 
+# Library output parameters, compiled once for all the reads
+_LINE_END_REGEX = re.compile(rb'[\r\n]')
+_BITRATE_REGEX = re.compile(rb'bitrate=[ ]*(\S+)')
+_TIME_REGEX = re.compile(rb'time=([0-9.:]+) ')
+
 
 class OutputReader:
     """Read the converter output."""
 
     def __init__(self):
         """Class initializer."""
-        self._params_regex = {
-            'bitrate': r'bitrate=[ ]*[0-9]*\.[0-9]*[a-z]*./[a-z]*',
-            'time': r'time=([0-9.:]+) '}
         self._library_errors = ('Unknown encoder',
                                 'Unrecognized option',
                                 'Invalid argument')
-        self._process_output = None
+        # Lines completed by the last read
+        self._lines = b''
+        # Incomplete line waiting for the rest of it to be read
+        self._buffer = bytearray()
+        self._time = None
+        self._bitrate = None
 
     def update_read(self, process_output):
-        """Update the process output."""
-        self._process_output = process_output
+        """Update the process output, return True if a full line was read.
+
+        The output comes in chunks that may split a line, so the incomplete
+        line is kept until the rest of it comes. Only the last progress
+        line is parsed, the previous ones are outdated.
+        """
+        self._buffer += process_output
+        line_end = max(self._buffer.rfind(b'\r'), self._buffer.rfind(b'\n'))
+        if line_end < 0:
+            self._lines = b''
+            return False
+
+        self._lines = bytes(self._buffer[:line_end])
+        del self._buffer[:line_end + 1]
+
+        self._time = self._bitrate = None
+        for line in reversed(_LINE_END_REGEX.split(self._lines)):
+            time_match = _TIME_REGEX.search(line)
+            if time_match is not None:
+                self._time = time_match.group(1)
+                bitrate_match = _BITRATE_REGEX.search(line)
+                if bitrate_match is not None:
+                    self._bitrate = bitrate_match.group(1)
+                break
+
+        return True
+
+    def reset(self):
+        """Forget the output of the previous conversion."""
+        self._lines = b''
+        self._buffer.clear()
+        self._time = self._bitrate = None
 
     def catch_library_error(self):
-        """Process the library errors."""
+        """Process the library errors.
+
+        An error may come split in two chunks, so the incomplete line is
+        checked along with the lines completed by the last read.
+        """
         for error in self._library_errors:
-            if error in self._process_output:
+            if error.encode() in self._lines or error.encode() in self._buffer:
                 return error
 
         return None
 
     @property
     def has_time_read(self):
-        """Return the time read."""
-        return self._read_output_param(param='time')
+        """Return True if the time was read."""
+        return self._time is not None
 
     @property
     def bitrate(self):
         """Return the bitrate read."""
-        bitrate_read = self._read_output_param(param='bitrate')
-
-        return bitrate_read[0].split('=')[-1].strip()
+        if self._bitrate is None:
+            return 'N/A'
+        return self._bitrate.decode('ascii', errors='replace')
 
     @property
     def time(self):
         """Convert time read to seconds."""
         seconds = 0.0
-        for time_part in self.has_time_read[0].split(':'):
+        for time_part in self._time.split(b':'):
             seconds = 60 * seconds + float(time_part)
 
         return seconds
-
-    def _read_output_param(self, param):
-        """Read library output looking for some parameters."""
-        pattern = re.compile(self._params_regex[param])
-
-        return pattern.findall(self._process_output)
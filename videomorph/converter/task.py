@@ -35,7 +35,24 @@ class Task:
         self.video = video
         self.profile = profile
         self.output_dir = output_dir
-        self.status = STATUS.todo
+        self._status = STATUS.todo
+        # The output path and what it was built from, to build it just once
+        self._output_path = None
+        self._output_path_key = None
+        # Called with the task and its old status when the status changes
+        self.status_changed = None
+
+    @property
+    def status(self):
+        """Return the task conversion status."""
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        """Set the task conversion status."""
+        old_status, self._status = self._status, status
+        if self.status_changed is not None and old_status != status:
+            self.status_changed(self, old_status)
 
     def build_conversion_cmd(self, target_quality, tagged, subtitle):
         """Return the conversion command."""
@@ -101,10 +118,15 @@ class Task:
     def _get_output_path(self, tagged):
         """Return the the output file path as pathlib.Path."""
         tag = self.profile.quality_tag if tagged else ''
-        output_file_name = ''.join((tag,
-                                    self.video.get_name(False),
-                                    self.profile.extension))
-        return Path(self.output_dir, output_file_name)
+        key = (tag, self.profile.extension, self.output_dir)
+        if key != self._output_path_key:
+            output_file_name = ''.join((tag,
+                                        self.video.get_name(False),
+                                        self.profile.extension))
+            self._output_path = Path(self.output_dir, output_file_name)
+            self._output_path_key = key
+
+        return self._output_path
 
     @property
     def subtitle_path(self):
@@ -20,9 +20,12 @@
 """This module provides the definition of TaskList and Video classes."""
 
 from collections import deque
+from os.path import basename
+from os.path import realpath
+from os.path import splitext
 
 from . import STATUS
-from .video import Video
+from . import VALID_VIDEO_EXT
 from .task import Task
 from .exceptions import InvalidMetadataError
 
@@ -36,43 +39,55 @@ class TaskList(list):
         self._profile = profile
         self._position = None  # None, no item running, 0, the first item,...
         self.not_added_files = deque()
+        # Canonical paths of the videos in the list, to find them quickly
+        self._paths = set()
+        # Duration of the tasks to do, kept up to date as they change
+        self._todo_duration = 0.0
 
     def clear(self):
         """Clear the list of videos."""
+        for task in self:
+            task.status_changed = None
         super(TaskList, self).clear()
+        self._paths.clear()
+        self._todo_duration = 0.0
         self.position = None
 
-    def populate(self, files_paths, output_dir):
-        """Populate TaskList object with Video objects.
+    def files_to_add(self, files_paths):
+        """Return a list with the files that need a Video to be added.
 
-        Args:
-            files_paths (iterable): list of files paths
-            output_dir (str): output directory
-        Yield:
-            Element 1: Total number of video files to process
-            Element 2,...: file path for the processed video file
+        Duplicated files and files already in the list are skipped and
+        files without a video extension are recorded in not_added_files,
+        so they are not probed.
         """
-        files_paths_to_add = self._filter_by_path(files_paths)
-
-        if files_paths_to_add is None:
-            return
+        return self._filter_by_extension(self._filter_by_path(files_paths))
 
-        self.not_added_files.clear()
+    def add_video(self, video, output_dir):
+        """Add a conversion task for a video.
 
-        # First, it yields the total number of video files to process
-        yield len(files_paths_to_add)
+        If the video metadata is not valid, it is recorded in
+        not_added_files instead.
+        """
+        try:
+            self._add_task(Task(video, self._profile, output_dir))
+        except InvalidMetadataError:
+            self.not_added_files.append(video.get_name())
 
-        for task in self._task_generator(files_paths_to_add, output_dir):
-            try:
-                self._add_task(task)
-                yield task.video.get_name()
-            except InvalidMetadataError:
-                self.not_added_files.append(task.video.get_name())
-                yield task.video.get_name()
+    def add_videos(self, videos, output_dir):
+        """Add a conversion task for each video of a batch."""
+        for video in videos:
+            self.add_video(video, output_dir)
 
     def delete_file(self, position):
         """Delete a video file from the list."""
+        task = self[position]
+        task.status_changed = None
+        if task.status == STATUS.todo:
+            self._todo_duration -= task.video.duration
+        self._paths.discard(self._canonical_path(task))
         del self[position]
+        if not self:  # Don't keep rounding errors around
+            self._todo_duration = 0.0
 
     def get_task(self, position):
         """Return a file object."""
@@ -98,6 +113,10 @@ class TaskList(list):
         """Return general streaming info from a video file."""
         return self[position].video.format_info[info_param]
 
+    def get_file_duration(self, position):
+        """Return the duration of a video file in seconds."""
+        return self[position].video.duration
+
     def running_file_name(self, with_extension=True):
         """Return the running file name."""
         return self._running_task.video.get_name(with_extension)
@@ -106,6 +125,10 @@ class TaskList(list):
         """Return running file info."""
         return self._running_task.video.format_info[info_param]
 
+    def running_file_duration(self):
+        """Return the running file duration in seconds."""
+        return self._running_task.video.duration
+
     @property
     def running_task_status(self):
         """Return file status."""
@@ -168,8 +191,7 @@ class TaskList(list):
     @property
     def duration(self):
         """Return the duration time of TaskList counting files to do only."""
-        return sum(float(task.video.format_info['duration']) for
-                   task in self if task.status == STATUS.todo)
+        return self._todo_duration
 
     @property
     def _running_task(self):
@@ -178,40 +200,50 @@ class TaskList(list):
 
     def _add_task(self, task):
         """Add a video file to the list."""
-        # Invalid metadata
-        try:
-            # Duration is not a valid float() argument
-            duration = float(task.video.format_info['duration'])
-        except (TypeError, ValueError):
-            raise InvalidMetadataError('Invalid video duration')
-
-        # Duration = 0
-        if duration > 0:
+        # Invalid metadata, duration is missing, not a number or zero
+        if task.video.duration > 0:
             self.append(task)
+            self._paths.add(self._canonical_path(task))
+            task.status_changed = self._on_task_status_changed
+            if task.status == STATUS.todo:
+                self._todo_duration += task.video.duration
         else:
-            raise InvalidMetadataError('Video is zero size')
+            raise InvalidMetadataError('Invalid video duration')
 
-    def _task_generator(self, files_paths, output_dir):
-        """Yield Video objects to be added to TaskList."""
-        for file_path in files_paths:
-            video = Video(file_path)
-            yield Task(video, self._profile, output_dir)
+    def _on_task_status_changed(self, task, old_status):
+        """Keep the duration of the tasks to do up to date."""
+        if old_status == STATUS.todo:
+            self._todo_duration -= task.video.duration
+        elif task.status == STATUS.todo:
+            self._todo_duration += task.video.duration
 
     def _filter_by_path(self, files_paths):
-        """Return a list with files to add to media list."""
-        if self.length:
-            filtered_paths = [file_path for file_path in files_paths if
-                              self._file_not_added(file_path)]
-            if not filtered_paths:
-                return None
+        """Return a list with files to add to media list.
 
-            return filtered_paths
+        Paths are compared in their canonical form, so a file given twice
+        (e.g. through a relative path or a symlink) or already in the list
+        is skipped, the first given path is the one kept.
+        """
+        unique_paths = {}
+        for file_path in files_paths:
+            canonical_path = realpath(file_path)
+            if canonical_path not in self._paths:
+                unique_paths.setdefault(canonical_path, file_path)
 
-        return files_paths
+        return list(unique_paths.values())
 
-    def _file_not_added(self, file_path):
-        """Determine if a video file is already in the list."""
-        for task in self:
-            if task.video.path.__str__() == file_path:
-                return False
-        return True
+    def _filter_by_extension(self, files_paths):
+        """Return a list with the files that have a video extension."""
+        filtered_paths = []
+        for file_path in files_paths:
+            if splitext(file_path)[1].lower() in VALID_VIDEO_EXT:
+                filtered_paths.append(file_path)
+            else:
+                self.not_added_files.append(basename(file_path))
+
+        return filtered_paths
+
+    @staticmethod
+    def _canonical_path(task):
+        """Return the canonical path to the video file of a task."""
+        return realpath(str(task.video.path))
@@ -63,15 +63,19 @@ class ConversionTimer:
         """Return the operation progress percentage."""
         return int(self._operation_time_read / file_duration * 100)
 
-    def process_progress(self, list_duration):
-        """"Calculate total progress percentage."""
+    def process_progress(self, todo_duration):
+        """"Calculate total progress percentage.
+
+        The todo_duration counts the running file and the ones to go, the
+        files already converted are added up here.
+        """
         if self._partial_time > self._operation_time_read:
             self._time_jump += self._partial_time
 
         self._total_time = self._time_jump + self._operation_time_read
         self._partial_time = self._operation_time_read
 
-        return int(self._total_time / float(list_duration) * 100)
+        return int(self._total_time / (self._time_jump + todo_duration) * 100)
 
     def operation_remaining_time(self, file_duration):
         """Return the operation remaining time."""
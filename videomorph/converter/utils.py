@@ -20,7 +20,9 @@
 """This module contains some utilities and functions."""
 
 import os
+from os import scandir
 from os.path import pathsep
+from os.path import splitext
 from pathlib import Path
 from locale import getdefaultlocale
 
@@ -91,3 +93,28 @@ def write_size(size_in_bytes):
         return str(round(mib, 1)) + 'MiB'
     gib = mib / 1024
     return str(round(gib, 1)) + 'GiB'
+
+
+def iter_video_files(directory, extensions):
+    """Yield the paths to the video files in a directory recursively.
+
+    The video files are told apart by their extension, which must be in
+    extensions (lowercase, with the leading dot).
+
+    os.scandir() reports the file type along with the directory entries,
+    so no extra stat call is needed per file.
+    """
+    directories = [directory]
+    while directories:
+        try:
+            entries = scandir(directories.pop())
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif (splitext(entry.name)[1].lower() in extensions and
+                      entry.is_file()):
+                    yield entry.path
@@ -17,11 +17,29 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-"""This module provides Video Class."""
+"""This module provides Video, VideoCreator and VideoSearcher Classes."""
 
+from os import fspath
+from os import stat
+from os.path import basename
+from os.path import realpath
+from os.path import splitext
 from pathlib import Path
+from weakref import WeakValueDictionary
 
+from PyQt5.QtCore import QObject
+from PyQt5.QtCore import QRunnable
+from PyQt5.QtCore import QThread
+from PyQt5.QtCore import QThreadPool
+from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import pyqtSignal
+
+from . import VALID_VIDEO_EXT
 from .probe import Probe
+from .utils import iter_video_files
+
+# Probes alive in this session, videos of the same file share their Probe
+_PROBES = WeakValueDictionary()
 
 
 class Video:
@@ -30,14 +48,284 @@ class Video:
     def __init__(self, video_path):
         """Class initializer."""
         self.path = Path(video_path)
-        self._info = Probe(self.path)
+        self._path_str = fspath(video_path)
+        self._name = basename(self._path_str)
+        self._stem = splitext(self._name)[0]
+        self._probe = None
+
+    @property
+    def _info(self):
+        """Return the video Probe, it is created only when first needed."""
+        if self._probe is None:
+            self._probe = _get_probe(self._path_str)
+
+        return self._probe
 
     def __getattr__(self, attr):
-        """Delegate to get info about the video."""
-        return getattr(self._info, attr)
+        """Delegate to get info about the video, caching the value."""
+        # Private names are never delegated, this avoids infinite recursion
+        # when the instance is not fully initialized (e.g. while unpickling)
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        value = getattr(self._info, attr)
+        object.__setattr__(self, attr, value)
+        return value
 
     def get_name(self, with_extension=True):
         """Return the file name."""
         if with_extension:
-            return self.path.name
-        return self.path.stem
+            return self._name
+        return self._stem
+
+
+class VideoCreator(QObject):
+    """Create Video objects probing them in a pool of threads.
+
+    Probing is I/O bound (disk reads and ffprobe runs), so the videos are
+    probed in parallel by the global QThreadPool and the GUI thread is
+    free while videos are created. Created videos are emitted in the
+    given order and in batches to cut the per video overhead on large adds.
+
+    Files can be given in several calls to create_videos() (e.g. while a
+    directory is searched), end_input() tells there are no more files.
+    """
+
+    createdVideosBatch = pyqtSignal(list)
+    # Emitted with the path of a file that couldn't be probed
+    failedVideo = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    # Emit a batch when it has this many videos or after this many msecs
+    _BATCH_SIZE = 32
+    _BATCH_INTERVAL = 100
+
+    def __init__(self, parent=None):
+        """Class initializer."""
+        super(VideoCreator, self).__init__(parent)
+        self._files_count = 0
+        self._input_ended = False
+        # Videos probed ahead of the next one to emit, keyed by position
+        self._probed_videos = {}
+        self._next_position = 0
+        self._probe_state = _ProbeState()
+        self._probe_state.probed.connect(self._on_video_probed)
+        self._probe_state.failed.connect(self.failedVideo)
+        self._finished = False
+        self._batch = []
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.setInterval(self._BATCH_INTERVAL)
+        self._batch_timer.timeout.connect(self._emit_batch)
+
+    def create_videos(self, files_paths):
+        """Start creating the videos, they are emitted in batches."""
+        thread_pool = QThreadPool.globalInstance()
+        thread_pool.setMaxThreadCount(max(4, QThread.idealThreadCount()))
+        for file_path in files_paths:
+            thread_pool.start(_VideoProbeRunnable(self._files_count,
+                                                  file_path,
+                                                  self._probe_state))
+            self._files_count += 1
+
+    def end_input(self):
+        """No more files to go, finished is emitted when all are created."""
+        self._input_ended = True
+        self._finish_if_done()
+
+    def cancel(self):
+        """Stop creating videos, finished is emitted when probes are done."""
+        # Runnables not started yet return without probing
+        self._probe_state.canceled = True
+
+    def _on_video_probed(self, position, video):
+        """Batch the probed videos in order, finish when all are probed."""
+        self._probed_videos[position] = video
+        while self._next_position in self._probed_videos:
+            video = self._probed_videos.pop(self._next_position)
+            self._next_position += 1
+            if video is not None and not self._probe_state.canceled:
+                self._add_to_batch(video)
+
+        self._finish_if_done()
+
+    def _finish_if_done(self):
+        """Emit the last batch and the finished signal, just once."""
+        # Slots connected to createdVideosBatch may process events, so this
+        # can be reached more than once after the last video is created
+        if (self._input_ended and self._next_position == self._files_count
+                and not self._finished):
+            self._finished = True
+            self._emit_batch()
+            self.finished.emit()
+
+    def _add_to_batch(self, video):
+        """Add a created video to the batch, emit it if it is full."""
+        self._batch.append(video)
+        if len(self._batch) >= self._BATCH_SIZE:
+            self._emit_batch()
+        elif not self._batch_timer.isActive():
+            self._batch_timer.start()
+
+    def _emit_batch(self):
+        """Emit the batch of created videos, if any."""
+        self._batch_timer.stop()
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self.createdVideosBatch.emit(batch)
+
+
+class _ProbeState(QObject):
+    """State shared by the probe runnables of a VideoCreator.
+
+    It has no parent, so the runnables keep it alive even if the creator
+    is deleted, the probed signal is queued to the GUI thread.
+    """
+
+    probed = pyqtSignal(int, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self):
+        """Class initializer."""
+        super(_ProbeState, self).__init__()
+        self.canceled = False
+
+
+class _VideoProbeRunnable(QRunnable):
+    """Create a Video and probe its duration in a pool thread."""
+
+    def __init__(self, position, file_path, probe_state):
+        """Class initializer."""
+        super(_VideoProbeRunnable, self).__init__()
+        self._position = position
+        self._file_path = file_path
+        self._probe_state = probe_state
+
+    def run(self):
+        """Probe the video, None is reported if canceled or on failure."""
+        video = None
+        if not self._probe_state.canceled:
+            # An exception escaping run() aborts the app, and the creator
+            # would wait forever for this video to be reported anyway
+            try:
+                video = Video(self._file_path)
+                video.probe_duration()
+            except Exception:
+                video = None
+                self._probe_state.failed.emit(self._file_path)
+        self._probe_state.probed.emit(self._position, video)
+
+
+class VideoSearcher(QObject):
+    """Search directories for video files in a pool thread.
+
+    The search can take long for large directory trees (or slow storage),
+    so it runs in the global QThreadPool and the GUI thread is free. The
+    files found are streamed in batches, so they can be added right away.
+    """
+
+    # Emitted with a batch of video files found
+    foundVideoFiles = pyqtSignal(list)
+    # Emitted with the directory and the number of video files found
+    searchFinished = pyqtSignal(str, int)
+
+    def __init__(self, parent=None):
+        """Class initializer."""
+        super(VideoSearcher, self).__init__(parent)
+        self._search_state = None
+
+    def search(self, directory):
+        """Start searching, searchFinished is emitted when done."""
+        # A search still running must not report to the new one
+        self.cancel()
+        self._search_state = _SearchState()
+        self._search_state.found.connect(self._on_files_found)
+        self._search_state.searched.connect(self._on_searched)
+        QThreadPool.globalInstance().start(
+            _VideoSearchRunnable(directory, self._search_state))
+
+    def cancel(self):
+        """Stop the current search, nothing else is emitted for it."""
+        if self._search_state is not None:
+            self._search_state.canceled = True
+            self._search_state = None
+
+    def _on_files_found(self, files_paths):
+        """Report a batch of files, unless the search was canceled."""
+        # Batches already queued when canceled still get here
+        if self.sender() is self._search_state:
+            self.foundVideoFiles.emit(files_paths)
+
+    def _on_searched(self, directory, files_count):
+        """Report the end of the search, unless it was canceled."""
+        if self.sender() is self._search_state:
+            # Let the state go as soon as its runnable is done
+            self._search_state = None
+            self.searchFinished.emit(directory, files_count)
+
+
+class _SearchState(QObject):
+    """State shared by a VideoSearcher and its search runnable.
+
+    It has no parent, so the runnable keeps it alive even if the searcher
+    is deleted, the signals are queued to the GUI thread.
+    """
+
+    found = pyqtSignal(list)
+    searched = pyqtSignal(str, int)
+
+    def __init__(self):
+        """Class initializer."""
+        super(_SearchState, self).__init__()
+        self.canceled = False
+
+
+class _VideoSearchRunnable(QRunnable):
+    """Search a directory for video files in a pool thread."""
+
+    # Number of files found to report at once
+    _BATCH_SIZE = 64
+
+    def __init__(self, directory, search_state):
+        """Class initializer."""
+        super(_VideoSearchRunnable, self).__init__()
+        self._directory = directory
+        self._search_state = search_state
+
+    def run(self):
+        """Search the directory reporting the files found in batches."""
+        files_count = 0
+        batch = []
+        for file_path in iter_video_files(self._directory,
+                                          VALID_VIDEO_EXT):
+            if self._search_state.canceled:
+                break
+            batch.append(file_path)
+            if len(batch) >= self._BATCH_SIZE:
+                self._search_state.found.emit(batch)
+                files_count += len(batch)
+                batch = []
+
+        if batch and not self._search_state.canceled:
+            self._search_state.found.emit(batch)
+            files_count += len(batch)
+
+        self._search_state.searched.emit(self._directory, files_count)
+
+
+def _get_probe(video_path):
+    """Return the Probe of a file, reusing it if the file is already probed.
+
+    Probes are shared while some video holds them, a file that changed
+    since its Probe was created gets a new one.
+    """
+    try:
+        file_stat = stat(video_path)
+    except OSError:
+        return Probe(video_path)
+
+    key = (realpath(video_path), file_stat.st_mtime_ns, file_stat.st_size)
+    probe = _PROBES.get(key)
+    if probe is None:
+        probe = _PROBES.setdefault(key, Probe(video_path))
+
+    return probe
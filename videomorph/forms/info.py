@@ -187,6 +187,11 @@ class InfoDialog(QtWidgets.QDialog):
 
         self.setMinimumSize(whole_layout.minimumSize())
 
+    def set_position(self, position):
+        """Show the info of the video at another position."""
+        self.position = position
+        self._show_video_info(position)
+
     def _show_video_info(self, position):
         """Show video info on the Info Panel."""
         task = self.task_list.get_task(position)
@@ -196,7 +201,7 @@ class InfoDialog(QtWidgets.QDialog):
         self.label_size_value.setText(
             write_size(task.video.format_info['size']))
         self.label_duration_value.setText(
-            write_time(task.video.format_info['duration']))
+            write_time(task.video.duration))
         self.label_format_name_value.setText(
             task.video.format_info['format_name'])
         self.label_format_long_name_value.setText(
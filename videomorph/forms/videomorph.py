@@ -19,9 +19,11 @@
 
 """This module defines the VideoMorph main window that holds the UI."""
 
-from collections import OrderedDict
-from functools import partial
+from contextlib import contextmanager
+from functools import lru_cache
+from time import monotonic
 from os.path import join as join_path
+from os.path import basename
 from os.path import dirname
 from os.path import exists
 from os.path import isdir
@@ -31,9 +33,14 @@ from PyQt5.QtCore import QSize
 from PyQt5.QtCore import Qt
 from PyQt5.QtCore import QSettings
 from PyQt5.QtCore import QDir
+from PyQt5.QtCore import QEvent
 from PyQt5.QtCore import QPoint
 from PyQt5.QtCore import QProcess
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import QObject
+from PyQt5.QtCore import QRunnable
+from PyQt5.QtCore import QThreadPool
+from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QMainWindow
 from PyQt5.QtWidgets import QWidget
@@ -66,13 +73,14 @@ from videomorph.converter import SYS_PATHS
 from videomorph.converter import VERSION
 from videomorph.converter import VIDEO_FILTERS
 from videomorph.converter import VM_PATHS
-from videomorph.converter.console import search_directory_recursively
 from videomorph.converter.exceptions import PlayerNotFoundError
 from videomorph.converter.library import Library
 from videomorph.converter.tasklist import TaskList
 from videomorph.converter.launchers import launcher_factory
 from videomorph.converter.profile import Profile
 from videomorph.converter.utils import write_time
+from videomorph.converter.video import VideoCreator
+from videomorph.converter.video import VideoSearcher
 from videomorph.converter.vmpath import LIBRARY_PATH
 
 from . import COLUMNS
@@ -83,19 +91,87 @@ from .addprofile import AddProfileDialog
 from .changelog import ChangelogDialog
 from .info import InfoDialog
 
+# Paths built once at import time
+_CONFIG_INI = join_path(SYS_PATHS.config, 'config.ini')
+_SOUND_BASE_DIR = join_path(BASE_DIR, VM_PATHS.sounds)
+_SOUND_BASE = join_path(_SOUND_BASE_DIR, 'successful.wav')
+_SOUND_SYS = join_path(SYS_PATHS.sounds, 'successful.wav')
+_HELP_FILE = 'manual_es.pdf' if LOCALE == 'es_ES' else 'manual_en.pdf'
+_HELP_SYS = join_path(SYS_PATHS.help, _HELP_FILE)
+_HELP_BASE = join_path(BASE_DIR, VM_PATHS.help, _HELP_FILE)
+# Msecs to wait for the saved output folder to be checked on startup
+_DIR_CHECK_TIMEOUT = 1500
+# Msecs between conversion progress refreshes of the UI
+_PROGRESS_REFRESH_INTERVAL = 250
+# Secs an output file existence check is trusted for
+_OUTPUT_EXISTS_TTL = 1.0
+# Interface elements enabled by _update_ui: (name, window attribute)
+_UI_ELEMENTS = (('add', 'open_media_file_action'),
+                ('convert', 'convert_action'),
+                ('clear', 'clear_media_list_action'),
+                ('remove', 'remove_media_file_action'),
+                ('stop', 'stop_action'),
+                ('stop_all', 'stop_all_action'),
+                ('presets', 'quality_combo'),
+                ('profiles', 'profiles_combo'),
+                ('add_costume_profile', 'add_profile_action'),
+                ('import_profile', 'import_profile_action'),
+                ('restore_profile', 'restore_profile_action'),
+                ('output_dir', 'output_btn'),
+                ('subtitles_chb', 'subtitle_chb'),
+                ('delete_chb', 'delete_chb'),
+                ('tag_chb', 'tag_chb'),
+                ('shutdown_chb', 'shutdown_chb'),
+                ('play_input', 'play_input_media_file_action'),
+                ('play_output', 'play_output_media_file_action'),
+                ('info', 'info_action'))
+_UI_BITS = {name: 1 << bit for bit, (name, _) in enumerate(_UI_ELEMENTS)}
+_UI_WIDGETS = dict(_UI_ELEMENTS)
+_UI_ALL = (1 << len(_UI_ELEMENTS)) - 1
+
 
 class VideoMorphMW(QMainWindow):
     """VideoMorph Main Window class."""
 
+    # Emitted when the videos passed to add_media_files are in the list
+    mediaFilesAdded = pyqtSignal()
+
     def __init__(self):
         """Class initializer."""
         super(VideoMorphMW, self).__init__()
-        self.title = APP_NAME + ' ' + VERSION
+        self.title = f'{APP_NAME} {VERSION}'
         self.icon = self._get_app_icon()
         self.source_dir = QDir.homePath()
-        self.task_list_duration = 0.0
+        # App settings as they were loaded, only changes are written back
+        self._loaded_settings = {}
+        # Dialogs are created when first shown and then reused
+        self._about_dlg = None
+        self._changelog_dlg = None
+        self._info_dlg = None
+        self._output_dir_check = None
+        self._first_added_row = 0
+        # Conversion options, kept in sync with their check boxes
+        self._subtitled = False
+        self._delete_input = False
+        self._tagged = False
+        self._shutdown = False
+        # Enabled interface elements as a bit mask, see _UI_ELEMENTS
+        self._ui_state = None
+        # Name and duration of the file being converted
+        self._running_file_name = None
+        self._running_file_duration = 0.0
+        # (file name, library error) of the files that failed, they are
+        # shown when all the files are done
+        self._conversion_errors = []
+        # Table item showing the progress of the file being converted
+        self._progress_item = None
+        # Output files converted in this session, known to exist
+        self._produced_outputs = set()
+        # Output file existence checks, keyed by path: (time, exists)
+        self._output_exists_cache = {}
         self.no_library_msg = self.tr('Ffmpeg Library not Found'
                                       ' in your System')
+        self._rebuild_translations()
 
         self._setup_ui()
         self._setup_model()
@@ -110,12 +186,28 @@ class VideoMorphMW(QMainWindow):
         self.library.setup_converter(
             reader=self._ready_read,
             finisher=self._finish_file_encoding,
-            process_channel=QProcess.MergedChannels)
+            process_channel=QProcess.SeparateChannels)
 
         self.profile = Profile()
 
         self.task_list = TaskList(profile=self.profile)
 
+        self._resolve_asset_paths()
+
+        self._video_searcher = VideoSearcher(parent=self)
+        self._video_searcher.foundVideoFiles.connect(
+            self._on_video_files_found)
+        self._video_searcher.searchFinished.connect(
+            self._on_media_dir_searched)
+
+        # ffmpeg reports its progress many times per second, the UI is
+        # refreshed with the latest values at a lower rate
+        self._pending_progress = None
+        self._progress_refresh_timer = QTimer(self)
+        self._progress_refresh_timer.setSingleShot(True)
+        self._progress_refresh_timer.setInterval(_PROGRESS_REFRESH_INTERVAL)
+        self._progress_refresh_timer.timeout.connect(self._refresh_progress)
+
     def _setup_ui(self):
         """Setup UI."""
         self.central_widget = QWidget(self)
@@ -135,9 +227,7 @@ class VideoMorphMW(QMainWindow):
     @staticmethod
     def _get_app_icon():
         """Get app icon."""
-        icon = QIcon()
-        icon.addPixmap(QPixmap(':/icons/videomorph.ico'))
-        return icon
+        return _icon(':/icons/videomorph.ico')
 
     def _create_general_layout(self):
         """General layout."""
@@ -201,8 +291,8 @@ class VideoMorphMW(QMainWindow):
                                        statusTip=preset_tip,
                                        toolTip=preset_tip)
         self.quality_combo.setMinimumSize(QSize(200, 0))
-        self.profiles_combo.currentIndexChanged.connect(partial(
-            self.populate_quality_combo, self.quality_combo))
+        self.profiles_combo.currentIndexChanged.connect(
+            self._on_profile_changed)
         self.quality_combo.activated.connect(self._update_media_files_status)
         settings_layout.addWidget(self.quality_combo)
 
@@ -238,6 +328,9 @@ class VideoMorphMW(QMainWindow):
                                       statusTip=shutdown_text,
                                       toolTip=shutdown_text)
         settings_layout.addWidget(self.shutdown_chb)
+        for check_box in (self.subtitle_chb, self.delete_chb,
+                          self.tag_chb, self.shutdown_chb):
+            check_box.toggled.connect(self._on_option_toggled)
         settings_layout.addStretch()
 
         settings_gb.setLayout(settings_layout)
@@ -285,7 +378,7 @@ class VideoMorphMW(QMainWindow):
         self.output_btn = QToolButton(output_dir_gb,
                                       statusTip=outputbtn_tip,
                                       toolTip=outputbtn_tip)
-        self.output_btn.setIcon(QIcon(':/icons/output-folder.png'))
+        self.output_btn.setIcon(_icon(':/icons/output-folder.png'))
         self.output_btn.clicked.connect(self.output_directory)
         output_dir_layout.addWidget(self.output_btn)
 
@@ -332,169 +425,166 @@ class VideoMorphMW(QMainWindow):
         """
         action = QAction(kwargs['text'], self, triggered=kwargs['callback'])
 
-        try:
-            action.setIcon(kwargs['icon'])
-        except KeyError:
-            pass
+        icon = kwargs.get('icon')
+        if icon is not None:
+            action.setIcon(icon)
 
-        try:
-            action.setShortcut(kwargs['shortcut'])
-        except KeyError:
-            pass
+        shortcut = kwargs.get('shortcut')
+        if shortcut is not None:
+            action.setShortcut(shortcut)
 
-        try:
-            action.setToolTip(kwargs['tip'])
-            action.setStatusTip(kwargs['tip'])
-        except KeyError:
-            pass
+        tip = kwargs.get('tip')
+        if tip is not None:
+            action.setToolTip(tip)
+            action.setStatusTip(tip)
 
-        try:
-            action.setCheckable(kwargs['checkable'])
-        except KeyError:
-            pass
+        checkable = kwargs.get('checkable')
+        if checkable is not None:
+            action.setCheckable(checkable)
 
         return action
 
     def _create_actions(self):
         """Create actions."""
-        actions = {'open_media_file_action':
-                   dict(icon=QIcon(':/icons/video-file.png'),
-                        text=self.tr('&Add Videos...'),
-                        shortcut="Ctrl+O",
-                        tip=self.tr('Add Videos to the '
-                                    'List of Conversion Tasks'),
-                        callback=self.open_media_files),
-
-                   'open_media_dir_action':
-                   dict(icon=QIcon(':/icons/add-folder.png'),
-                        text=self.tr('Add &Folder...'),
-                        shortcut="Ctrl+D",
-                        tip=self.tr('Add all the Video Files in a Folder '
-                                    'to the List of Conversion Tasks'),
-                        callback=self.open_media_dir),
-
-                   'add_profile_action':
-                   dict(icon=QIcon(':/icons/add-profile.png'),
-                        text=self.tr('&Add Customized Profile...'),
-                        shortcut="Ctrl+F",
-                        tip=self.tr('Add Customized Profile'),
-                        callback=self.add_customized_profile),
-
-                   'export_profile_action':
-                   dict(icon=QIcon(':/icons/export.png'),
-                        text=self.tr('&Export Conversion Profiles...'),
-                        shortcut="Ctrl+E",
-                        tip=self.tr('Export Conversion Profiles'),
-                        callback=self.export_profiles),
-
-                   'import_profile_action':
-                   dict(icon=QIcon(':/icons/import.png'),
-                        text=self.tr('&Import Conversion Profiles...'),
-                        shortcut="Ctrl+I",
-                        tip=self.tr('Import Conversion Profiles'),
-                        callback=self.import_profiles),
-
-                   'restore_profile_action':
-                   dict(icon=QIcon(':/icons/default-profile.png'),
-                        text=self.tr('&Restore the Default '
+        actions = (('open_media_file_action',
+                    dict(icon=_icon(':/icons/video-file.png'),
+                         text=self.tr('&Add Videos...'),
+                         shortcut="Ctrl+O",
+                         tip=self.tr('Add Videos to the '
+                                     'List of Conversion Tasks'),
+                         callback=self.open_media_files)),
+
+                   ('open_media_dir_action',
+                    dict(icon=_icon(':/icons/add-folder.png'),
+                         text=self.tr('Add &Folder...'),
+                         shortcut="Ctrl+D",
+                         tip=self.tr('Add all the Video Files in a Folder '
+                                     'to the List of Conversion Tasks'),
+                         callback=self.open_media_dir)),
+
+                   ('add_profile_action',
+                    dict(icon=_icon(':/icons/add-profile.png'),
+                         text=self.tr('&Add Customized Profile...'),
+                         shortcut="Ctrl+F",
+                         tip=self.tr('Add Customized Profile'),
+                         callback=self.add_customized_profile)),
+
+                   ('export_profile_action',
+                    dict(icon=_icon(':/icons/export.png'),
+                         text=self.tr('&Export Conversion Profiles...'),
+                         shortcut="Ctrl+E",
+                         tip=self.tr('Export Conversion Profiles'),
+                         callback=self.export_profiles)),
+
+                   ('import_profile_action',
+                    dict(icon=_icon(':/icons/import.png'),
+                         text=self.tr('&Import Conversion Profiles...'),
+                         shortcut="Ctrl+I",
+                         tip=self.tr('Import Conversion Profiles'),
+                         callback=self.import_profiles)),
+
+                   ('restore_profile_action',
+                    dict(icon=_icon(':/icons/default-profile.png'),
+                         text=self.tr('&Restore the Default '
+                                      'Conversion Profiles'),
+                         tip=self.tr('Restore the Default '
                                      'Conversion Profiles'),
-                        tip=self.tr('Restore the Default Conversion Profiles'),
-                        callback=self.restore_profiles),
-
-                   'play_input_media_file_action':
-                   dict(icon=QIcon(':/icons/video-player-input.png'),
-                        text=self.tr('Play Input Video'),
-                        callback=self.play_video),
-
-                   'play_output_media_file_action':
-                   dict(icon=QIcon(':/icons/video-player-output.png'),
-                        text=self.tr('Play Output Video'),
-                        callback=self.play_video),
-
-                   'clear_media_list_action':
-                   dict(icon=QIcon(':/icons/clear-list.png'),
-                        text=self.tr('Clear &List'),
-                        shortcut="Ctrl+Del",
-                        tip=self.tr('Remove all the Video from the '
-                                    'List of Conversion Tasks'),
-                        callback=self.clear_media_list),
-
-                   'remove_media_file_action':
-                   dict(icon=QIcon(':/icons/remove-file.png'),
-                        text=self.tr('&Remove Video'),
-                        shortcut="Del",
-                        tip=self.tr('Remove Selected Video from the '
-                                    'List of Conversion Tasks'),
-                        callback=self.remove_media_file),
-
-                   'convert_action':
-                   dict(icon=QIcon(':/icons/convert.png'),
-                        text=self.tr('&Convert'),
-                        shortcut="Ctrl+R",
-                        tip=self.tr('Start Conversion Process'),
-                        callback=self.start_encoding),
-
-                   'stop_action':
-                   dict(icon=QIcon(':/icons/stop.png'),
-                        text=self.tr('&Stop'),
-                        shortcut="Ctrl+P",
-                        tip=self.tr('Stop Current Video Conversion'),
-                        callback=self.stop_file_encoding),
-
-                   'stop_all_action':
-                   dict(icon=QIcon(':/icons/stop-all.png'),
-                        text=self.tr('S&top All'),
-                        shortcut="Ctrl+A",
-                        tip=self.tr('Stop all Video Conversions'),
-                        callback=self.stop_all_files_encoding),
-
-                   'about_action':
-                   dict(text=self.tr('&About') + ' ' + APP_NAME,
-                        tip=self.tr('About') + ' ' + APP_NAME + ' ' + VERSION,
-                        callback=self.about),
-
-                   'help_content_action':
-                   dict(icon=QIcon(':/icons/about.png'),
-                        text=self.tr('&Contents'),
-                        shortcut="Ctrl+H",
-                        tip=self.tr('Help Contents'),
-                        callback=self.help_content),
-
-                   'changelog_action':
-                   dict(icon=QIcon(':/icons/changelog.png'),
-                        text=self.tr('Changelog'),
-                        tip=self.tr('Changelog'),
-                        callback=self.changelog),
-
-                   'ffmpeg_doc_action':
-                   dict(icon=QIcon(':/icons/ffmpeg.png'),
-                        text=self.tr('&Ffmpeg Documentation'),
-                        shortcut="Ctrl+L",
-                        tip=self.tr('Open Ffmpeg On-Line Documentation'),
-                        callback=self.ffmpeg_doc),
-
-                   'videomorph_web_action':
-                   dict(icon=QIcon(':/logo/videomorph.png'),
-                        text=APP_NAME + ' ' + self.tr('&Web Page'),
-                        shortcut="Ctrl+V",
-                        tip=self.tr('Open') + ' ' + APP_NAME + ' ' + self.tr(
-                            'Web Page'),
-                        callback=self.videomorph_web),
-
-                   'exit_action':
-                   dict(icon=QIcon(':/icons/exit.png'),
-                        text=self.tr('E&xit'),
-                        shortcut="Ctrl+Q",
-                        tip=self.tr('Exit') + ' ' + APP_NAME + ' ' + VERSION,
-                        callback=self.close),
-
-                   'info_action':
-                   dict(text=self.tr('Properties...'),
-                        tip=self.tr('Show Video Properties'),
-                        callback=self.show_video_info)}
-
-        for action in actions:
-            self.__dict__[action] = self._action_factory(**actions[action])
+                         callback=self.restore_profiles)),
+
+                   ('play_input_media_file_action',
+                    dict(icon=_icon(':/icons/video-player-input.png'),
+                         text=self.tr('Play Input Video'),
+                         callback=self.play_video)),
+
+                   ('play_output_media_file_action',
+                    dict(icon=_icon(':/icons/video-player-output.png'),
+                         text=self.tr('Play Output Video'),
+                         callback=self.play_video)),
+
+                   ('clear_media_list_action',
+                    dict(icon=_icon(':/icons/clear-list.png'),
+                         text=self.tr('Clear &List'),
+                         shortcut="Ctrl+Del",
+                         tip=self.tr('Remove all the Video from the '
+                                     'List of Conversion Tasks'),
+                         callback=self.clear_media_list)),
+
+                   ('remove_media_file_action',
+                    dict(icon=_icon(':/icons/remove-file.png'),
+                         text=self.tr('&Remove Video'),
+                         shortcut="Del",
+                         tip=self.tr('Remove Selected Video from the '
+                                     'List of Conversion Tasks'),
+                         callback=self.remove_media_file)),
+
+                   ('convert_action',
+                    dict(icon=_icon(':/icons/convert.png'),
+                         text=self.tr('&Convert'),
+                         shortcut="Ctrl+R",
+                         tip=self.tr('Start Conversion Process'),
+                         callback=self.start_encoding)),
+
+                   ('stop_action',
+                    dict(icon=_icon(':/icons/stop.png'),
+                         text=self.tr('&Stop'),
+                         shortcut="Ctrl+P",
+                         tip=self.tr('Stop Current Video Conversion'),
+                         callback=self.stop_file_encoding)),
+
+                   ('stop_all_action',
+                    dict(icon=_icon(':/icons/stop-all.png'),
+                         text=self.tr('S&top All'),
+                         shortcut="Ctrl+A",
+                         tip=self.tr('Stop all Video Conversions'),
+                         callback=self.stop_all_files_encoding)),
+
+                   ('about_action',
+                    dict(text=self.tr('&About') + ' ' + APP_NAME,
+                         tip=self.tr('About') + ' ' + APP_NAME + ' ' + VERSION,
+                         callback=self.about)),
+
+                   ('help_content_action',
+                    dict(icon=_icon(':/icons/about.png'),
+                         text=self.tr('&Contents'),
+                         shortcut="Ctrl+H",
+                         tip=self.tr('Help Contents'),
+                         callback=self.help_content)),
+
+                   ('changelog_action',
+                    dict(icon=_icon(':/icons/changelog.png'),
+                         text=self.tr('Changelog'),
+                         tip=self.tr('Changelog'),
+                         callback=self.changelog)),
+
+                   ('ffmpeg_doc_action',
+                    dict(icon=_icon(':/icons/ffmpeg.png'),
+                         text=self.tr('&Ffmpeg Documentation'),
+                         shortcut="Ctrl+L",
+                         tip=self.tr('Open Ffmpeg On-Line Documentation'),
+                         callback=self.ffmpeg_doc)),
+
+                   ('videomorph_web_action',
+                    dict(icon=_icon(':/logo/videomorph.png'),
+                         text=APP_NAME + ' ' + self.tr('&Web Page'),
+                         shortcut="Ctrl+V",
+                         tip=self.tr('Open') + ' ' + APP_NAME + ' ' + self.tr(
+                             'Web Page'),
+                         callback=self.videomorph_web)),
+
+                   ('exit_action',
+                    dict(icon=_icon(':/icons/exit.png'),
+                         text=self.tr('E&xit'),
+                         shortcut="Ctrl+Q",
+                         tip=self.tr('Exit') + ' ' + APP_NAME + ' ' + VERSION,
+                         callback=self.close)),
+
+                   ('info_action',
+                    dict(text=self.tr('Properties...'),
+                         tip=self.tr('Show Video Properties'),
+                         callback=self.show_video_info)))
+
+        for action_name, action_kwargs in actions:
+            setattr(self, action_name, self._action_factory(**action_kwargs))
 
     def _create_context_menu(self):
         first_separator = QAction(self)
@@ -599,12 +689,11 @@ class VideoMorphMW(QMainWindow):
 
     @staticmethod
     def _get_settings_file():
-        return QSettings(join_path(SYS_PATHS.config, 'config.ini'),
-                         QSettings.IniFormat)
+        return QSettings(_CONFIG_INI, QSettings.IniFormat)
 
     def _create_initial_settings(self):
         """Create initial settings file."""
-        if not exists(join_path(SYS_PATHS.config, 'config.ini')):
+        if not exists(_CONFIG_INI):
             self._write_app_settings(pos=QPoint(100, 50),
                                      size=QSize(1096, 510),
                                      profile_index=0,
@@ -618,52 +707,109 @@ class VideoMorphMW(QMainWindow):
         size = settings.value("size", QSize(1096, 510), type=QSize)
         self.resize(size)
         self.move(pos)
-        if 'profile_index' and 'preset_index' in settings.allKeys():
+        if (settings.contains('profile_index') and
+                settings.contains('preset_index')):
             profile = settings.value('profile_index')
             preset = settings.value('preset_index')
             self.profiles_combo.setCurrentIndex(int(profile))
             self.quality_combo.setCurrentIndex(int(preset))
-        if 'output_dir' in settings.allKeys():
-            directory = str(settings.value('output_dir'))
-            output_dir = directory if isdir(directory) else QDir.homePath()
-            self.output_edit.setText(output_dir)
-        if 'source_dir' in settings.allKeys():
+        if settings.contains('output_dir'):
+            # Keep the home folder until the saved one is checked
+            self._check_output_dir(str(settings.value('output_dir')))
+        if settings.contains('source_dir'):
             self.source_dir = str(settings.value('source_dir'))
 
+        # The saved output folder is left as it is unless the check
+        # reports it is gone or the user chooses another one
+        self._loaded_settings = self._get_app_settings()
+
+    def _check_output_dir(self, directory):
+        """Check the saved output folder in a pool thread.
+
+        The folder may be on a dead network mount, which would stall the
+        startup, so the check is given up after a while.
+        """
+        self._output_dir_check = _DirectoryCheck(directory)
+        self._output_dir_check.checked.connect(self._on_output_dir_checked)
+        QTimer.singleShot(_DIR_CHECK_TIMEOUT, self._output_dir_check.cancel)
+        QThreadPool.globalInstance().start(
+            _DirectoryCheckRunnable(self._output_dir_check))
+
+    def _on_output_dir_checked(self, directory, directory_exists):
+        """Use the saved output folder if it is still there."""
+        if self._output_dir_check is None or self._output_dir_check.canceled:
+            return
+
+        self._output_dir_check = None
+        if not directory_exists:
+            # The file holds the saved folder, so the home one is written
+            # back to replace it
+            self._loaded_settings['output_dir'] = directory
+            return
+
+        previous_dir = self.output_edit.text()
+        self.output_edit.setText(directory)
+        # The videos added while checking got the home folder, they go to
+        # the saved one too, unless their conversion already started
+        for position, task in enumerate(self.task_list):
+            if (task.output_dir == previous_dir and
+                    task.status == STATUS.todo and
+                    not (self.library.converter_is_running and
+                         position == self.task_list.position)):
+                task.output_dir = directory
+        # It is the saved one, so there is no need to write it back
+        self._loaded_settings['output_dir'] = directory
+
+    def _get_app_settings(self):
+        """Return a dict with the current app settings."""
+        return dict(pos=self.pos(),
+                    size=self.size(),
+                    profile_index=self.profiles_combo.currentIndex(),
+                    preset_index=self.quality_combo.currentIndex(),
+                    source_dir=self.source_dir,
+                    output_dir=self.output_edit.text())
+
     def _write_app_settings(self, **app_settings):
         """Write app settings on exit.
 
+        Just the settings that changed since they were loaded (or last
+        written) are written, and the settings file is synced once.
+
         Args:
-            app_settings (OrderedDict): OrderedDict to collect all app settings
+            app_settings (dict): Dict to collect all app settings
         """
         settings_file = self._get_settings_file()
 
-        settings = OrderedDict(
-            pos=self.pos(),
-            size=self.size(),
-            profile_index=self.profiles_combo.currentIndex(),
-            preset_index=self.quality_combo.currentIndex(),
-            source_dir=self.source_dir,
-            output_dir=self.output_edit.text())
+        settings = self._get_app_settings()
 
         if app_settings:
             settings.update(app_settings)
 
         for key, setting in settings.items():
-            settings_file.setValue(key, setting)
+            if (key not in self._loaded_settings or
+                    self._loaded_settings[key] != setting):
+                settings_file.setValue(key, setting)
 
-    def _show_message_box(self, type_, title, msg):
-        QMessageBox(type_, title, msg, QMessageBox.Ok, self).show()
+        settings_file.sync()
+        self._loaded_settings.update(settings)
+
+    def _show_message_box(self, type_, title, msg, detail=None):
+        msg_box = QMessageBox(type_, title, msg, QMessageBox.Ok, self)
+        if detail is not None:
+            msg_box.setDetailedText(detail)
+        msg_box.show()
 
     def about(self):
         """Show About dialog."""
-        about_dlg = AboutVMDialog(parent=self)
-        about_dlg.exec_()
+        if self._about_dlg is None:
+            self._about_dlg = AboutVMDialog(parent=self)
+        self._about_dlg.exec_()
 
     def changelog(self):
         """Show the changelog dialog."""
-        changelog_dlg = ChangelogDialog(parent=self)
-        changelog_dlg.exec_()
+        if self._changelog_dlg is None:
+            self._changelog_dlg = ChangelogDialog(parent=self)
+        self._changelog_dlg.exec_()
 
     def ffmpeg_doc(self):
         """Open ffmpeg documentation page."""
@@ -676,10 +822,14 @@ class VideoMorphMW(QMainWindow):
     def show_video_info(self):
         """Show video info on the Info Panel."""
         position = self.tasks_table.currentRow()
-        info_dlg = InfoDialog(parent=self,
-                              position=position,
-                              task_list=self.task_list)
-        info_dlg.show()
+        if self._info_dlg is None:
+            self._info_dlg = InfoDialog(parent=self,
+                                        position=position,
+                                        task_list=self.task_list)
+        else:
+            self._info_dlg.set_position(position)
+        self._info_dlg.show()
+        self._info_dlg.raise_()
 
     def notify(self, file_name):
         """Notify when conversion finished."""
@@ -687,12 +837,8 @@ class VideoMorphMW(QMainWindow):
         msg = file_name + ': ' + self.tr('Successfully converted')
         self.tray_icon.showMessage(APP_NAME, msg,
                                    QSystemTrayIcon.Information, 2000)
-        if exists(join_path(BASE_DIR, VM_PATHS.sounds)):
-            sound = join_path(BASE_DIR, VM_PATHS.sounds, 'successful.wav')
-        else:
-            sound = join_path(SYS_PATHS.sounds, 'successful.wav')
         launcher = launcher_factory()
-        launcher.sound_notify(sound)
+        launcher.sound_notify(self._sound_path)
 
     @staticmethod
     def _open_url(url):
@@ -700,22 +846,22 @@ class VideoMorphMW(QMainWindow):
         launcher = launcher_factory()
         launcher.open_with_user_browser(url=url)
 
-    @staticmethod
-    def help_content():
+    def help_content(self):
         """Open ffmpeg documentation page."""
-        if LOCALE == 'es_ES':
-            file_name = 'manual_es.pdf'
-        else:
-            file_name = 'manual_en.pdf'
+        launcher = launcher_factory()
+        launcher.open_with_user_browser(url=self._help_url)
 
-        file_path = join_path(SYS_PATHS.help, file_name)
-        if isfile(file_path):
-            url = join_path('file:', file_path)
+    def _resolve_asset_paths(self):
+        """Find the notification sound and the help file just once."""
+        if exists(_SOUND_BASE_DIR):
+            self._sound_path = _SOUND_BASE
         else:
-            url = join_path('file:', BASE_DIR, VM_PATHS.help, file_name)
+            self._sound_path = _SOUND_SYS
 
-        launcher = launcher_factory()
-        launcher.open_with_user_browser(url=url)
+        if isfile(_HELP_SYS):
+            self._help_url = join_path('file:', _HELP_SYS)
+        else:
+            self._help_url = join_path('file:', _HELP_BASE)
 
     @staticmethod
     def shutdown_machine():
@@ -733,9 +879,13 @@ class VideoMorphMW(QMainWindow):
         profile_names = self.profile.get_xml_profile_qualities(LOCALE).keys()
         for i, profile_name in enumerate(profile_names):
             self.profiles_combo.addItem(profile_name)
-            icon = QIcon(':/formats/{0}.png'.format(profile_name))
+            icon = _icon(':/formats/{0}.png'.format(profile_name))
             self.profiles_combo.setItemIcon(i, icon)
 
+    def _on_profile_changed(self):
+        """Populate the target quality combobox for the new profile."""
+        self.populate_quality_combo(self.quality_combo)
+
     def populate_quality_combo(self, combo):
         """Populate target quality combobox.
 
@@ -760,9 +910,32 @@ class VideoMorphMW(QMainWindow):
             source_dir=self.output_edit.text())
 
         if directory:
+            # The user choice wins over the saved folder still being checked
+            if self._output_dir_check is not None:
+                self._output_dir_check.cancel()
+            if directory != self.output_edit.text():
+                # The outputs checked so far are in the previous folder
+                self._output_exists_cache.clear()
             self.output_edit.setText(directory)
             self._on_modify_conversion_option()
 
+    def _rebuild_translations(self):
+        """Translate the strings used on every conversion progress update."""
+        self._tr_to_convert = self.tr('To Convert')
+        self._tr_stopped = self.tr('Stopped!')
+        self._tr_done = self.tr('Done!')
+        self._tr_adding_video = self.tr('Adding Video: ')
+        self._tr_converting = self.tr('Converting: {m}\t\t\t '
+                                      'At: {br}\t\t\t '
+                                      'Operation Remaining Time: {ort}\t\t\t '
+                                      'Total Elapsed Time: {tet}')
+
+    def changeEvent(self, event):
+        """Translate the cached strings again if the language changes."""
+        if event.type() == QEvent.LanguageChange:
+            self._rebuild_translations()
+        super(VideoMorphMW, self).changeEvent(event)
+
     def closeEvent(self, event):
         """Things to do on close."""
         # Close communication and kill the encoding process
@@ -781,8 +954,7 @@ class VideoMorphMW(QMainWindow):
                     connected=self._finish_file_encoding)
                 self.library.kill_converter()
                 self.library.close_converter()
-                self.task_list.delete_running_file_output(
-                    tagged=self.tag_chb.checkState())
+                self._delete_running_output()
                 # Save settings
                 self._write_app_settings()
                 event.accept()
@@ -793,37 +965,99 @@ class VideoMorphMW(QMainWindow):
             self._write_app_settings()
             event.accept()
 
+    def _start_media_list_filling(self):
+        """Get ready to fill the media list, files can be given in batches."""
+        # Update tool buttons so you can convert, or add_file, or clear...
+        # only if there is not a conversion process running
+        if self.library.converter_is_running:
+            self._update_ui_when_converter_running()
+        else:
+            # Update the files status
+            self._set_media_status()
+            # Update ui
+            self.update_ui_when_ready()
+
+        self.task_list.not_added_files.clear()
+        # Rows for the new videos are added batch by batch from here on
+        self._first_added_row = self.task_list.length
+
+        self._progress_dlg = self._create_progress_dialog()
+        # The maximum grows as files are given, so the dialog must not be
+        # reset when the value catches up with it, it is closed when done
+        self._progress_dlg.setAutoReset(False)
+        self._progress_dlg.setAutoClose(False)
+
+        self._video_creator = VideoCreator(parent=self)
+        self._video_creator.createdVideosBatch.connect(
+            self._on_videos_batch_created)
+        self._video_creator.failedVideo.connect(self._on_video_failed)
+        self._video_creator.finished.connect(self._on_videos_created)
+        self._progress_dlg.canceled.connect(self._cancel_media_list_filling)
+
+    def _cancel_media_list_filling(self):
+        """Stop adding videos, the ones already created are kept."""
+        self._video_searcher.cancel()
+        self._video_creator.cancel()
+        # Don't wait for the probes still running, a new add can start
+        # right away and this one must not report to it
+        self._on_videos_created()
+
     def _fill_media_list(self, files_paths):
         """Fill TaskList object with Video objects."""
-        progress_dlg = self._create_progress_dialog()
-        populator = self.task_list.populate(files_paths,
-                                            self.output_edit.text())
-        for i, element in enumerate(populator):
-            if not i:  # First element yielded
-                progress_dlg.setMaximum(element)
-            else:  # Second and on...
-                progress_dlg.setLabelText(self.tr('Adding Video: ') + element)
-                progress_dlg.setValue(i)
-
-            if progress_dlg.wasCanceled():
-                break
+        files_paths = self.task_list.files_to_add(files_paths)
+        if not files_paths:
+            return
 
-        progress_dlg.close()
+        self._progress_dlg.setMaximum(
+            self._progress_dlg.maximum() + len(files_paths))
+        self._video_creator.create_videos(files_paths)
+
+    def _on_videos_batch_created(self, videos):
+        """Add a batch of just created videos to the TaskList."""
+        first_position = self.task_list.length
+        self.task_list.add_videos(videos, self.output_edit.text())
+        # Show the new rows right away, the table is updated once per batch
+        self._create_table(rows=range(first_position, self.task_list.length))
+        self._progress_dlg.setLabelText(
+            self._tr_adding_video + videos[-1].get_name())
+        self._progress_dlg.setValue(self._progress_dlg.value() + len(videos))
+
+    def _on_video_failed(self, file_path):
+        """Report a video that couldn't be probed as not added."""
+        self.task_list.not_added_files.append(basename(file_path))
+
+    def _on_videos_created(self):
+        """Finish adding videos when all of them are created."""
+        # Closing the dialog emits canceled, it must not get here again
+        self._progress_dlg.canceled.disconnect(self._cancel_media_list_filling)
+        self._progress_dlg.close()
+        self._progress_dlg.deleteLater()
+        # Nothing else is reported by this creator, even if canceled
+        self._video_creator.blockSignals(True)
+        self._video_creator.deleteLater()
 
         if self.task_list.not_added_files:
-            msg = self.tr('Invalid Video Information for:') + ' \n - ' + \
-                  '\n - '.join(self.task_list.not_added_files) + '\n' + \
-                  self.tr('Video not Added to the List of Conversion Tasks')
+            # The files go to the detailed text, which is scrollable and
+            # rendered only if the user asks for it
+            msg = '{0}\n{1}'.format(
+                self.tr('Video not Added to the List of Conversion Tasks'),
+                self.tr('Invalid Video Information for:'))
             self._show_message_box(
                 type_=QMessageBox.Critical,
                 title=self.tr('Error!'),
-                msg=msg)
+                msg=msg,
+                detail='\n'.join(self.task_list.not_added_files))
 
             if not self.task_list.length:
                 self._update_ui_when_no_file()
             else:
                 self.update_ui_when_ready()
 
+        # Refresh the rows that were in the table before adding videos
+        self._create_table(rows=range(self._first_added_row))
+
+        self.mediaFilesAdded.emit()
+
     def _load_files(self, source_dir=QDir.homePath()):
         """Load video files."""
         files_paths = self._select_files(
@@ -835,26 +1069,58 @@ class VideoMorphMW(QMainWindow):
         return files_paths
 
     def _insert_table_item(self, item_text, row, column):
+        # Reuse the cell item when the row is refreshed, this avoids
+        # allocating a new item and replacing it in the model
+        item = self.tasks_table.item(row, column)
+        if item is not None:
+            item.setText(item_text)
+            return
+
         item = QTableWidgetItem()
         item.setText(item_text)
         if column == COLUMNS.NAME:
-            item.setIcon(QIcon(':/icons/video-in-list.png'))
+            item.setIcon(_icon(':/icons/video-in-list.png'))
         self.tasks_table.setItem(row, column, item)
 
-    def _create_table(self):
+    def _create_table(self, rows=None):
+        """Fill the tasks table in bulk, repainting it just once.
+
+        Args:
+            rows (range): Rows to fill, all of them if None
+        """
+        with self._bulk_table_update():
+            self._fill_table_rows(rows)
+
+    @contextmanager
+    def _bulk_table_update(self):
+        """Update many table cells, repainting the table just once."""
+        table = self.tasks_table
+        sorting_enabled = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        signals_blocked = table.blockSignals(True)
+        try:
+            yield
+        finally:
+            table.blockSignals(signals_blocked)
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+
+    def _fill_table_rows(self, rows=None):
         self.tasks_table.setRowCount(self.task_list.length)
+        if rows is None:
+            rows = range(self.tasks_table.rowCount())
         # Call converter_is_running only once
         converter_is_running = self.library.converter_is_running
-        for row in range(self.tasks_table.rowCount()):
+        for row in rows:
             self._insert_table_item(
                 item_text=self.task_list.get_file_name(position=row),
                 row=row, column=COLUMNS.NAME)
 
             self._insert_table_item(
                 item_text=str(write_time(
-                    self.task_list.get_file_info(
-                        position=row,
-                        info_param='duration'))),
+                    self.task_list.get_file_duration(position=row))),
                 row=row, column=COLUMNS.DURATION)
 
             self._insert_table_item(
@@ -863,10 +1129,10 @@ class VideoMorphMW(QMainWindow):
 
             if converter_is_running:
                 if row > self.task_list.position:
-                    self._insert_table_item(item_text=self.tr('To Convert'),
+                    self._insert_table_item(item_text=self._tr_to_convert,
                                             row=row, column=COLUMNS.PROGRESS)
             else:
-                self._insert_table_item(item_text=self.tr('To Convert'),
+                self._insert_table_item(item_text=self._tr_to_convert,
                                         row=row, column=COLUMNS.PROGRESS)
 
     def add_media_files(self, *files):
@@ -875,22 +1141,10 @@ class VideoMorphMW(QMainWindow):
         Args:
             files (list): List of video file paths
         """
-        # Update tool buttons so you can convert, or add_file, or clear...
-        # only if there is not a conversion process running
-        if self.library.converter_is_running:
-            self._update_ui_when_converter_running()
-        else:
-            # Update the files status
-            self._set_media_status()
-            # Update ui
-            self.update_ui_when_ready()
-
+        self._start_media_list_filling()
+        # Videos are added asynchronously, mediaFilesAdded is emitted then
         self._fill_media_list(files)
-
-        self._create_table()
-
-        # After adding files to the list, recalculate the list duration
-        self.task_list_duration = self.task_list.duration
+        self._video_creator.end_input()
 
     def play_video(self):
         """Play a video using an available video player."""
@@ -899,9 +1153,16 @@ class VideoMorphMW(QMainWindow):
         self._play_media_file(file_path=video_path)
         self._update_ui_when_playing(row)
 
+    def _on_option_toggled(self):
+        """Keep the conversion options read on every task at hand."""
+        self._subtitled = self.subtitle_chb.isChecked()
+        self._delete_input = self.delete_chb.isChecked()
+        self._tagged = self.tag_chb.isChecked()
+        self._shutdown = self.shutdown_chb.isChecked()
+
     def _get_output_path(self, row):
         path = self.task_list.get_task(row).get_output_path(
-            tagged=self.tag_chb.checkState())
+            tagged=self._tagged)
         return path
 
     def _play_media_file(self, file_path):
@@ -932,15 +1193,25 @@ class VideoMorphMW(QMainWindow):
         if not directory:
             return
 
-        try:
-            media_files = search_directory_recursively(directory)
+        # The directory is searched in a pool thread, don't block the GUI,
+        # the files found are added while the search goes on
+        self._start_media_list_filling()
+        self._video_searcher.search(directory)
+
+    def _on_video_files_found(self, files_paths):
+        """Add a batch of media files found in a directory."""
+        self._fill_media_list(files_paths)
+
+    def _on_media_dir_searched(self, directory, files_count):
+        """Finish adding the media files found in a directory."""
+        self._video_creator.end_input()
+        if files_count:
             self.source_dir = directory
-            self.add_media_files(*media_files)
-        except FileNotFoundError:
+        else:
             self._show_message_box(
                 type_=QMessageBox.Critical,
                 title=self.tr('Error!'),
-                msg=self.tr('No Videos Found in:' + ' ' + directory))
+                msg=self.tr('No Videos Found in: ') + directory)
 
     def remove_media_file(self):
         """Remove selected media file from the list."""
@@ -956,12 +1227,13 @@ class VideoMorphMW(QMainWindow):
         msg_box.addButton(self.tr("&No"), QMessageBox.RejectRole)
 
         if msg_box.exec_() == QMessageBox.AcceptRole:
+            self._output_exists_cache.pop(
+                self._get_output_path(row=file_row), None)
             # Delete file from table
             self.tasks_table.removeRow(file_row)
             # Remove file from self.media_list
             self.task_list.delete_file(position=file_row)
             self.task_list.position = None
-            self.task_list_duration = self.task_list.duration
 
         # If all files are deleted... update the interface
         if not self.tasks_table.rowCount():
@@ -1082,6 +1354,8 @@ class VideoMorphMW(QMainWindow):
             self.tasks_table.setRowCount(0)
             # Clear TaskList so it contains no element
             self.task_list.clear()
+            self._produced_outputs.clear()
+            self._output_exists_cache.clear()
             # Update UI
             self._reset_options_check_boxes()
             self._update_ui_when_no_file()
@@ -1092,6 +1366,11 @@ class VideoMorphMW(QMainWindow):
 
         self.task_list.position += 1
         self.library.timer.operation_start_time = 0.0
+        # Read on every progress update, so get them just once per file
+        self._running_file_name = self.task_list.running_file_name()
+        self._running_file_duration = self.task_list.running_file_duration()
+        self._progress_item = self.tasks_table.item(self.task_list.position,
+                                                    COLUMNS.PROGRESS)
 
         if self.task_list.running_task_status == STATUS.todo:
             try:
@@ -1100,9 +1379,11 @@ class VideoMorphMW(QMainWindow):
                     target_quality=self.tasks_table.item(
                         self.task_list.position,
                         COLUMNS.QUALITY).text(),
-                    tagged=self.tag_chb.checkState(),
-                    subtitle=bool(self.subtitle_chb.checkState()))
+                    tagged=self._tagged,
+                    subtitle=self._subtitled)
                 # Then pass it to the _converter
+                self.library.reader.reset()
+                self.library.error = None
                 self.library.start_converter(cmd=conversion_cmd)
             except PermissionError:
                 self._show_message_box(
@@ -1114,9 +1395,9 @@ class VideoMorphMW(QMainWindow):
                 self._show_message_box(
                     type_=QMessageBox.Critical,
                     title=self.tr('Error!'),
-                    msg=(self.tr('Input Video:') + ' ' +
-                         self.task_list.running_file_name() + ' ' +
-                         self.tr('not Found')))
+                    msg='{0} {1} {2}'.format(self.tr('Input Video:'),
+                                             self._running_file_name,
+                                             self.tr('not Found')))
                 self._update_ui_when_error_on_conversion()
             # except FileExistsError:
             #     self._show_message_box(
@@ -1135,60 +1416,71 @@ class VideoMorphMW(QMainWindow):
 
     def stop_file_encoding(self):
         """Stop file encoding process and continue with the list."""
+        self._cancel_progress_refresh()
         # Terminate the file encoding
         self.library.stop_converter()
         # Set Video.status attribute
         self.task_list.running_task_status = STATUS.stopped
         # Delete the file when conversion is stopped by the user
-        self.task_list.delete_running_file_output(
-            tagged=self.tag_chb.checkState())
-        # Update the list duration and partial time for total progress bar
+        self._delete_running_output()
+        # Reset the partial time for total progress bar
         self.library.timer.reset_progress_times()
-        self.task_list_duration = self.task_list.duration
+
+    def _delete_running_output(self):
+        """Delete the output of the running task, it is not complete."""
+        output_path = self._get_output_path(row=self.task_list.position)
+        self._produced_outputs.discard(output_path)
+        self._output_exists_cache.pop(output_path, None)
+        self.task_list.delete_running_file_output(tagged=self._tagged)
 
     def stop_all_files_encoding(self):
         """Stop the conversion process for all the files in list."""
+        self._cancel_progress_refresh()
         # Delete the file when conversion is stopped by the user
         self.library.stop_converter()
-        self.task_list.delete_running_file_output(
-            tagged=self.tag_chb.checkState())
-        for media_file in self.task_list:
-            # Set Video.status attribute
-            if media_file.status != STATUS.done:
-                media_file.status = STATUS.stopped
-                self.task_list.position = self.task_list.index(media_file)
-                self.tasks_table.item(
-                    self.task_list.position,
-                    COLUMNS.PROGRESS).setText(self.tr('Stopped!'))
-
-        # Update the list duration and partial time for total progress bar
+        self._delete_running_output()
+        with self._bulk_table_update():
+            for position, media_file in enumerate(self.task_list):
+                # Set Video.status attribute
+                if media_file.status != STATUS.done:
+                    media_file.status = STATUS.stopped
+                    self.task_list.position = position
+                    self.tasks_table.item(
+                        position, COLUMNS.PROGRESS).setText(self._tr_stopped)
+
+        # Reset the partial time for total progress bar
         self.library.timer.reset_progress_times()
-        self.task_list_duration = self.task_list.duration
 
     def _finish_file_encoding(self):
         """Finish the file encoding process."""
+        self._cancel_progress_refresh()
         if self.task_list.running_task_status != STATUS.stopped:
             file_name = self.task_list.running_file_name()
             self.notify(file_name)
             # Close and kill the converterprocess
             self.library.close_converter()
+            if self.library.error is not None:
+                self._conversion_errors.append(
+                    (file_name, self.library.error))
             # Check if the process finished OK
             if (self.library.converter_exit_status() ==
                     QProcess.NormalExit):
                 # When finished a file conversion...
-                self.tasks_table.item(
-                    self.task_list.position,
-                    COLUMNS.PROGRESS).setText(self.tr('Done!'))
+                self._progress_item.setText(self._tr_done)
                 self.task_list.running_task_status = STATUS.done
+                # Trust only outputs that ffmpeg really wrote, a failed
+                # conversion can exit normally with no output file
+                if (not self.library.converter_exit_code() and
+                        self.library.error is None):
+                    self._produced_outputs.add(
+                        self._get_output_path(row=self.task_list.position))
                 self.operation_pb.setProperty("value", 0)
-                if self.delete_chb.checkState():
+                if self._delete_input:
                     self.task_list.delete_running_file_input()
         else:
             # If the process was stopped
             if not self.library.converter_is_running:
-                self.tasks_table.item(
-                    self.task_list.position,
-                    COLUMNS.PROGRESS).setText(self.tr('Stopped!'))
+                self._progress_item.setText(self._tr_stopped)
         # Attempt to end the conversion process
         self._end_encoding_process()
 
@@ -1197,16 +1489,19 @@ class VideoMorphMW(QMainWindow):
         # Test if encoding process is finished
         if self.task_list.is_exhausted:
 
-            if self.library.error is not None:
+            if self._conversion_errors:
                 self._show_message_box(
                     type_=QMessageBox.Critical,
                     title='Error!',
-                    msg=self.tr('The Conversion Library has '
-                                'Failed with Error:') + ' ' +
-                    self.library.error)
-                self.library.error = None
+                    msg='{0} {1}'.format(
+                        self.tr('The Conversion Library has '
+                                'Failed with Error:'),
+                        self._conversion_errors[-1][1]),
+                    detail='\n'.join('{0}: {1}'.format(*file_error) for
+                                     file_error in self._conversion_errors))
+                self._conversion_errors.clear()
             elif not self.task_list.all_stopped:
-                if self.shutdown_chb.checkState():
+                if self._shutdown:
                     self.shutdown_machine()
                     return
                 self._show_message_box(
@@ -1225,10 +1520,12 @@ class VideoMorphMW(QMainWindow):
             # Reset all progress related variables
             self._reset_progress_bars()
             self.library.timer.reset_progress_times()
-            self.task_list_duration = self.task_list.duration
             self.library.timer.process_start_time = 0.0
             # Reset the position
             self.task_list.position = None
+            self._running_file_name = None
+            self._running_file_duration = 0.0
+            self._progress_item = None
             # Update tool buttons
             self._update_ui_when_problem()
         else:
@@ -1241,10 +1538,10 @@ class VideoMorphMW(QMainWindow):
 
     def _ready_read(self):
         """Is called when the conversion process emit a new output."""
-        self.library.reader.update_read(
-            process_output=self.library.read_converter_output())
-
-        self._update_conversion_progress()
+        # Nothing to do until a full output line is read
+        if self.library.reader.update_read(
+                process_output=self.library.read_converter_output()):
+            self._update_conversion_progress()
 
     def _update_conversion_progress(self):
         """Read the encoding output from the converter stdout."""
@@ -1266,13 +1563,23 @@ class VideoMorphMW(QMainWindow):
 
         self.library.timer.update_cum_times()
 
-        file_duration = float(self.task_list.running_file_info('duration'))
-
         operation_progress = self.library.timer.operation_progress(
-            file_duration=file_duration)
+            file_duration=self._running_file_duration)
 
         process_progress = self.library.timer.process_progress(
-            list_duration=self.task_list_duration)
+            todo_duration=self.task_list.duration)
+
+        self._pending_progress = (operation_progress, process_progress)
+        if not self._progress_refresh_timer.isActive():
+            self._progress_refresh_timer.start()
+
+    def _refresh_progress(self):
+        """Show the latest conversion progress."""
+        if self._pending_progress is None:
+            return
+
+        operation_progress, process_progress = self._pending_progress
+        self._pending_progress = None
 
         self._update_progress(op_progress=operation_progress,
                               pr_progress=process_progress)
@@ -1281,38 +1588,32 @@ class VideoMorphMW(QMainWindow):
 
         self._update_main_window_title(op_progress=operation_progress)
 
+    def _cancel_progress_refresh(self):
+        """Drop the progress not shown yet, the running task is over."""
+        self._progress_refresh_timer.stop()
+        self._pending_progress = None
+
     def _update_progress(self, op_progress, pr_progress):
         """Update operation progress in tasks list & operation progress bar."""
         # Update operation progress bar
         self.operation_pb.setProperty("value", op_progress)
         # Update operation progress in tasks list
-        self.tasks_table.item(self.task_list.position, 3).setText(
-            str(op_progress) + "%")
+        self._progress_item.setText(str(op_progress) + "%")
         self.total_pb.setProperty("value", pr_progress)
 
     def _update_main_window_title(self, op_progress):
         """Update the main window title."""
-        running_file_name = self.task_list.running_file_name(
-            with_extension=True)
-
-        self.setWindowTitle(str(op_progress) + '%' + '-' +
-                            '[' + running_file_name + ']' +
-                            ' - ' + APP_NAME + ' ' + VERSION)
+        self.setWindowTitle(
+            f'{op_progress}%-[{self._running_file_name}] - {self.title}')
 
     def _update_status_bar(self):
         """Update the status bar while converting."""
-        file_duration = float(self.task_list.running_file_info('duration'))
-
         self.statusBar().showMessage(
-            self.tr('Converting: {m}\t\t\t '
-                    'At: {br}\t\t\t '
-                    'Operation Remaining Time: {ort}\t\t\t '
-                    'Total Elapsed Time: {tet}').format(
-                        m=self.task_list.running_file_name(
-                            with_extension=True),
+            self._tr_converting.format(
+                        m=self._running_file_name,
                         br=self.library.reader.bitrate,
                         ort=self.library.timer.operation_remaining_time(
-                            file_duration=file_duration),
+                            file_duration=self._running_file_duration),
                         tet=write_time(self.library.timer.process_cum_time)))
 
     def _update_media_files_status(self):
@@ -1337,31 +1638,29 @@ class VideoMorphMW(QMainWindow):
 
             self._set_media_status()
 
-        # Update total duration of the new tasks list
-        self.task_list_duration = self.task_list.duration
         # Update the interface
         self.update_ui_when_ready()
 
     def _update_all_table_rows(self, column, value):
         rows = self.tasks_table.rowCount()
         if rows:
-            for row in range(rows):
-                self.tasks_table.item(row, column).setText(
-                    str(value))
-                self.update_table_progress_column(row)
+            with self._bulk_table_update():
+                for row in range(rows):
+                    self.tasks_table.item(row, column).setText(
+                        str(value))
+                    self.update_table_progress_column(row)
 
     def update_table_progress_column(self, row):
         """Update the progress column of conversion task list."""
         if self.task_list.get_task_status(row) != STATUS.todo:
             self.tasks_table.item(
                 row,
-                COLUMNS.PROGRESS).setText(self.tr('To Convert'))
+                COLUMNS.PROGRESS).setText(self._tr_to_convert)
 
     def _reset_options_check_boxes(self):
         self.delete_chb.setChecked(False)
         self.tag_chb.setChecked(False)
         self.subtitle_chb.setChecked(False)
-        self.subtitle_chb.setChecked(False)
 
     def _set_media_status(self):
         """Update media files state of conversion."""
@@ -1374,56 +1673,32 @@ class VideoMorphMW(QMainWindow):
             self.update_ui_when_ready()
             self._set_media_status()
             self._update_all_table_rows(column=COLUMNS.PROGRESS,
-                                        value=self.tr('To Convert'))
-            self.task_list_duration = self.task_list.duration
+                                        value=self._tr_to_convert)
 
     def _update_ui(self, **i_vars):
-        """Update the interface status.
+        """Update the interface status, all is enabled unless told otherwise.
 
         Args:
             i_vars (dict): Dict to collect all the interface variables
         """
-        variables = dict(add=True,
-                         convert=True,
-                         clear=True,
-                         remove=True,
-                         stop=True,
-                         stop_all=True,
-                         presets=True,
-                         profiles=True,
-                         add_costume_profile=True,
-                         import_profile=True,
-                         restore_profile=True,
-                         output_dir=True,
-                         subtitles_chb=True,
-                         delete_chb=True,
-                         tag_chb=True,
-                         shutdown_chb=True,
-                         play_input=True,
-                         play_output=True,
-                         info=True)
-
-        variables.update(i_vars)
-
-        self.open_media_file_action.setEnabled(variables['add'])
-        self.convert_action.setEnabled(variables['convert'])
-        self.clear_media_list_action.setEnabled(variables['clear'])
-        self.remove_media_file_action.setEnabled(variables['remove'])
-        self.stop_action.setEnabled(variables['stop'])
-        self.stop_all_action.setEnabled(variables['stop_all'])
-        self.quality_combo.setEnabled(variables['presets'])
-        self.profiles_combo.setEnabled(variables['profiles'])
-        self.add_profile_action.setEnabled(variables['add_costume_profile'])
-        self.import_profile_action.setEnabled(variables['import_profile'])
-        self.restore_profile_action.setEnabled(variables['restore_profile'])
-        self.output_btn.setEnabled(variables['output_dir'])
-        self.subtitle_chb.setEnabled(variables['subtitles_chb'])
-        self.delete_chb.setEnabled(variables['delete_chb'])
-        self.tag_chb.setEnabled(variables['tag_chb'])
-        self.shutdown_chb.setEnabled(variables['shutdown_chb'])
-        self.play_input_media_file_action.setEnabled(variables['play_input'])
-        self.play_output_media_file_action.setEnabled(variables['play_output'])
-        self.info_action.setEnabled(variables['info'])
+        # Only the elements whose state changed are updated
+        ui_state = _UI_ALL
+        for name, enabled in i_vars.items():
+            if enabled:
+                ui_state |= _UI_BITS[name]
+            else:
+                ui_state &= ~_UI_BITS[name]
+
+        if self._ui_state is None:
+            changed = _UI_ALL
+        else:
+            changed = ui_state ^ self._ui_state
+        self._ui_state = ui_state
+
+        for name, attr in _UI_ELEMENTS:
+            if changed & _UI_BITS[name]:
+                getattr(self, attr).setEnabled(bool(ui_state & _UI_BITS[name]))
+
         self.tasks_table.setCurrentItem(None)
 
     def _update_ui_when_no_file(self):
@@ -1488,7 +1763,6 @@ class VideoMorphMW(QMainWindow):
 
     def _update_ui_when_error_on_conversion(self):
         self.library.timer.reset_progress_times()
-        self.task_list_duration = self.task_list.duration
         self.task_list.position = None
         self._reset_progress_bars()
         self.setWindowTitle(self.title)
@@ -1497,13 +1771,84 @@ class VideoMorphMW(QMainWindow):
 
     def _enable_context_menu_action(self):
         if not self.library.converter_is_running:
-            self.remove_media_file_action.setEnabled(True)
+            self._set_ui_element_enabled('remove', True)
 
-        self.play_input_media_file_action.setEnabled(True)
+        self._set_ui_element_enabled('play_input', True)
 
         path = self._get_output_path(row=self.tasks_table.currentIndex().row())
         # Only enable the menu if output file exist and if it not .mp4,
         # cause .mp4 files doesn't run until conversion is finished
-        self.play_output_media_file_action.setEnabled(
-            exists(path) and self.profiles_combo.currentText() != 'MP4')
-        self.info_action.setEnabled(bool(self.task_list.length))
+        self._set_ui_element_enabled(
+            'play_output',
+            self.profiles_combo.currentText() != 'MP4' and
+            self._output_exists(path))
+        self._set_ui_element_enabled('info', bool(self.task_list.length))
+
+    def _set_ui_element_enabled(self, name, enabled):
+        """Enable a single interface element, keeping the UI state in sync."""
+        if self._ui_state is not None:
+            if enabled:
+                self._ui_state |= _UI_BITS[name]
+            else:
+                self._ui_state &= ~_UI_BITS[name]
+        getattr(self, _UI_WIDGETS[name]).setEnabled(enabled)
+
+    def _output_exists(self, path):
+        """Return True if an output file exists, checking it once a while.
+
+        The menu is updated on every cell press, so the stat call is saved
+        when moving around the same rows.
+        """
+        # The outputs converted in this session need no check at all
+        if path in self._produced_outputs:
+            return True
+
+        now = monotonic()
+        checked_at, path_exists = self._output_exists_cache.get(
+            path, (None, False))
+        if checked_at is None or now - checked_at > _OUTPUT_EXISTS_TTL:
+            path_exists = exists(path)
+            self._output_exists_cache[path] = (now, path_exists)
+
+        return path_exists
+
+
+@lru_cache(maxsize=None)
+def _icon(resource_path):
+    """Return the QIcon for a resource, it is created just once."""
+    return QIcon(resource_path)
+
+
+class _DirectoryCheck(QObject):
+    """State shared with the runnable checking a directory.
+
+    It has no parent, so the runnable keeps it alive, the checked signal
+    is queued to the GUI thread.
+    """
+
+    # Emitted with the directory and whether it exists
+    checked = pyqtSignal(str, bool)
+
+    def __init__(self, directory):
+        """Class initializer."""
+        super(_DirectoryCheck, self).__init__()
+        self.directory = directory
+        self.canceled = False
+
+    def cancel(self):
+        """Ignore the check result."""
+        self.canceled = True
+
+
+class _DirectoryCheckRunnable(QRunnable):
+    """Check if a directory exists in a pool thread."""
+
+    def __init__(self, directory_check):
+        """Class initializer."""
+        super(_DirectoryCheckRunnable, self).__init__()
+        self._directory_check = directory_check
+
+    def run(self):
+        """Check the directory, it may block on dead network mounts."""
+        directory = self._directory_check.directory
+        self._directory_check.checked.emit(directory, isdir(directory))
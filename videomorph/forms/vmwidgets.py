@@ -132,6 +132,5 @@ class TargetQualityDelegate(QItemDelegate):
         self.parent.update_table_progress_column(row=index.row())
         self.parent.task_list.set_task_status(position=index.row(),
                                               status=STATUS.todo)
-        self.parent.total_duration = self.parent.task_list.duration
         self.parent.update_ui_when_ready()
         self.parent.tasks_table.setEditTriggers(QAbstractItemView.NoEditTriggers)